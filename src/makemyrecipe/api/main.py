@@ -1,22 +1,33 @@
 """Main FastAPI application entry point."""
 
+from contextlib import asynccontextmanager
 from pathlib import Path
+from typing import AsyncIterator
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import FileResponse
-from fastapi.staticfiles import StaticFiles
 
 from ..core.config import settings
 from ..core.logging import get_logger, setup_logging
 from .middleware import RequestLoggingMiddleware, SecurityHeadersMiddleware
 from .routes import chat, recipe, websocket
+from .static_files import CachedStaticFiles
 
 # Set up logging
 setup_logging()
 logger = get_logger(__name__)
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Build the OpenAPI schema once at startup."""
+    # FastAPI caches the result on app.openapi_schema, so /openapi.json and
+    # /docs never regenerate it per request.
+    app.openapi()
+    yield
+
+
 def create_app() -> FastAPI:
     """Create and configure the FastAPI application."""
     app = FastAPI(
@@ -26,6 +37,7 @@ def create_app() -> FastAPI:
         debug=settings.api_debug,
         docs_url="/docs",
         redoc_url="/redoc",
+        lifespan=lifespan,
     )
 
     # Add middleware
@@ -49,7 +61,13 @@ def create_app() -> FastAPI:
     # Mount static files
     static_path = Path(__file__).parent.parent.parent.parent / "static"
     if static_path.exists():
-        app.mount("/static", StaticFiles(directory=str(static_path)), name="static")
+        app.mount(
+            "/static",
+            CachedStaticFiles(
+                directory=str(static_path), max_age=settings.static_cache_max_age
+            ),
+            name="static",
+        )
 
     # Health check endpoint
     @app.get("/health")
@@ -1,9 +1,12 @@
 """Recipe recommendation API routes."""
 
-from typing import List, Optional
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from fastapi import APIRouter, HTTPException, Query
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from pydantic import BaseModel, Field
 
 from ...core.logging import get_logger
@@ -29,9 +32,92 @@ logger = get_logger(__name__)
 
 router = APIRouter(prefix="/recipes", tags=["recipes"])
 
+# Enhanced searches with more recipes than this are streamed one recipe at a time
+STREAMING_RECIPE_THRESHOLD = 20
 
-@router.post("/search", response_model=RecipeSearchResponse)
-async def search_recipes(request: RecipeSearchRequest) -> RecipeSearchResponse:
+# Number of enhanced search results kept by the search cache
+ENHANCED_SEARCH_CACHE_SIZE = 512
+
+# Seconds a cached enhanced search result stays fresh, since web results change
+ENHANCED_SEARCH_CACHE_TTL = 3600.0
+
+# Recipe fields that belong to one response and are regenerated on cache hits
+_PER_RESPONSE_RECIPE_FIELDS = frozenset(
+    {"id", "created_at", "updated_at", "user_notes", "is_saved"}
+)
+
+# (monotonic expiry time, recipe field values without the per-response fields,
+# raw LLM response)
+_CachedSearch = Tuple[float, List[Dict[str, Any]], Optional[str]]
+
+# LRU cache: request hash -> cached search result
+_enhanced_search_cache: "OrderedDict[bytes, _CachedSearch]" = OrderedDict()
+
+# Opening of a serialized EnhancedRecipeSearchResponse, whose first field is recipes
+_RECIPES_JSON_PREFIX = '{"recipes":['
+
+
+def _json_response(model: BaseModel) -> Response:
+    """Serialize a response model with pydantic-core, bypassing jsonable_encoder."""
+    return Response(content=model.model_dump_json(), media_type="application/json")
+
+
+def _enhanced_search_cache_key(request: RecipeSearchRequest) -> bytes:
+    """Hash a search request; serializing in field order normalizes key order."""
+    return hashlib.blake2b(request.model_dump_json().encode(), digest_size=16).digest()
+
+
+def _get_cached_enhanced_search(
+    cache_key: bytes,
+) -> Optional[Tuple[List[Recipe], Optional[str]]]:
+    """Rebuild a cached search result with fresh ids and timestamps."""
+    cached = _enhanced_search_cache.get(cache_key)
+    if cached is None:
+        return None
+    if cached[0] <= time.monotonic():
+        # Drop expired results now rather than waiting for LRU eviction
+        del _enhanced_search_cache[cache_key]
+        return None
+    _enhanced_search_cache.move_to_end(cache_key)
+    return [Recipe.model_validate(fields) for fields in cached[1]], cached[2]
+
+
+def _cache_enhanced_search(
+    cache_key: bytes, recipes: List[Recipe], raw_response: Optional[str]
+) -> None:
+    """Store a search result, evicting the least recently used one when full."""
+    _enhanced_search_cache[cache_key] = (
+        time.monotonic() + ENHANCED_SEARCH_CACHE_TTL,
+        [recipe.model_dump(exclude=_PER_RESPONSE_RECIPE_FIELDS) for recipe in recipes],
+        raw_response,
+    )
+    _enhanced_search_cache.move_to_end(cache_key)
+    if len(_enhanced_search_cache) > ENHANCED_SEARCH_CACHE_SIZE:
+        _enhanced_search_cache.popitem(last=False)
+
+
+def _iter_enhanced_search_json(
+    recipes: List[Recipe], search_query: str, raw_response: Optional[str]
+) -> Iterator[str]:
+    """Yield an EnhancedRecipeSearchResponse body one recipe at a time."""
+    # Serialize the envelope without recipes and splice them in after the prefix
+    envelope = EnhancedRecipeSearchResponse(
+        recipes=[],
+        total_count=len(recipes),
+        search_query=search_query,
+        raw_response=raw_response,
+    ).model_dump_json()
+
+    yield _RECIPES_JSON_PREFIX
+    for position, recipe in enumerate(recipes):
+        if position:
+            yield ","
+        yield recipe.model_dump_json()
+    yield envelope[len(_RECIPES_JSON_PREFIX) :]
+
+
+@router.post("/search", responses={200: {"model": RecipeSearchResponse}})
+async def search_recipes(request: RecipeSearchRequest) -> Response:
     """
     Search for recipes based on user query and filters.
 
@@ -57,11 +143,13 @@ async def search_recipes(request: RecipeSearchRequest) -> RecipeSearchResponse:
             convert_recipe_result_to_response(recipe) for recipe in recipe_results
         ]
 
-        return RecipeSearchResponse(
-            recipes=recipe_responses,
-            total_count=len(recipe_responses),
-            search_query=request.query,
-            raw_response=raw_response,
+        return _json_response(
+            RecipeSearchResponse(
+                recipes=recipe_responses,
+                total_count=len(recipe_responses),
+                search_query=request.query,
+                raw_response=raw_response,
+            )
         )
 
     except Exception as e:
@@ -69,10 +157,12 @@ async def search_recipes(request: RecipeSearchRequest) -> RecipeSearchResponse:
         raise HTTPException(status_code=500, detail=f"Recipe search failed: {str(e)}")
 
 
-@router.post("/search/enhanced", response_model=EnhancedRecipeSearchResponse)
+@router.post(
+    "/search/enhanced", responses={200: {"model": EnhancedRecipeSearchResponse}}
+)
 async def search_recipes_enhanced(
     request: RecipeSearchRequest,
-) -> EnhancedRecipeSearchResponse:
+) -> Response:
     """
     Enhanced recipe search with comprehensive citation support.
 
@@ -81,20 +171,39 @@ async def search_recipes_enhanced(
     interaction features, and enhanced metadata.
     """
     try:
-        # Convert request to internal query format
-        query_params = convert_search_request_to_query(request)
-
-        # Search for recipes using enhanced method
-        recipes, raw_response = await recipe_service.search_recipes_enhanced(
-            user_query=request.query,
-            query_params=query_params,
-        )
-
-        return EnhancedRecipeSearchResponse(
-            recipes=recipes,
-            total_count=len(recipes),
-            search_query=request.query,
-            raw_response=raw_response,
+        # Repeated searches reuse the service result, but every caller still
+        # gets its own recipe ids and timestamps
+        cache_key = _enhanced_search_cache_key(request)
+        cached = _get_cached_enhanced_search(cache_key)
+        if cached is not None:
+            recipes, raw_response = cached
+        else:
+            # Convert request to internal query format
+            query_params = convert_search_request_to_query(request)
+
+            # Search for recipes using enhanced method
+            recipes, raw_response = await recipe_service.search_recipes_enhanced(
+                user_query=request.query,
+                query_params=query_params,
+            )
+
+            # Only cache searches that found recipes, so empty answers get retried
+            if recipes:
+                _cache_enhanced_search(cache_key, recipes, raw_response)
+
+        if len(recipes) > STREAMING_RECIPE_THRESHOLD:
+            return StreamingResponse(
+                _iter_enhanced_search_json(recipes, request.query, raw_response),
+                media_type="application/json",
+            )
+
+        return _json_response(
+            EnhancedRecipeSearchResponse(
+                recipes=recipes,
+                total_count=len(recipes),
+                search_query=request.query,
+                raw_response=raw_response,
+            )
         )
 
     except Exception as e:
@@ -104,10 +213,12 @@ async def search_recipes_enhanced(
         )
 
 
-@router.post("/suggestions/ingredients", response_model=RecipeSearchResponse)
+@router.post(
+    "/suggestions/ingredients", responses={200: {"model": RecipeSearchResponse}}
+)
 async def get_ingredient_suggestions(
     request: IngredientSuggestionRequest,
-) -> RecipeSearchResponse:
+) -> Response:
     """
     Get recipe suggestions based on available ingredients.
 
@@ -130,11 +241,13 @@ async def get_ingredient_suggestions(
 
         user_query = f"What can I make with {', '.join(request.ingredients)}?"
 
-        return RecipeSearchResponse(
-            recipes=recipe_responses,
-            total_count=len(recipe_responses),
-            search_query=user_query,
-            raw_response=raw_response,
+        return _json_response(
+            RecipeSearchResponse(
+                recipes=recipe_responses,
+                total_count=len(recipe_responses),
+                search_query=user_query,
+                raw_response=raw_response,
+            )
         )
 
     except Exception as e:
@@ -144,8 +257,8 @@ async def get_ingredient_suggestions(
         )
 
 
-@router.post("/cuisine", response_model=RecipeSearchResponse)
-async def get_cuisine_recipes(request: CuisineRecipeRequest) -> RecipeSearchResponse:
+@router.post("/cuisine", responses={200: {"model": RecipeSearchResponse}})
+async def get_cuisine_recipes(request: CuisineRecipeRequest) -> Response:
     """
     Get recipes for a specific cuisine type.
 
@@ -169,11 +282,13 @@ async def get_cuisine_recipes(request: CuisineRecipeRequest) -> RecipeSearchResp
         if request.difficulty:
             user_query += f" ({request.difficulty.value} level)"
 
-        return RecipeSearchResponse(
-            recipes=recipe_responses,
-            total_count=len(recipe_responses),
-            search_query=user_query,
-            raw_response=raw_response,
+        return _json_response(
+            RecipeSearchResponse(
+                recipes=recipe_responses,
+                total_count=len(recipe_responses),
+                search_query=user_query,
+                raw_response=raw_response,
+            )
         )
 
     except Exception as e:
@@ -181,14 +296,14 @@ async def get_cuisine_recipes(request: CuisineRecipeRequest) -> RecipeSearchResp
         raise HTTPException(status_code=500, detail=f"Cuisine recipes failed: {str(e)}")
 
 
-@router.get("/quick-search")
+@router.get("/quick-search", responses={200: {"model": RecipeSearchResponse}})
 async def quick_recipe_search(
     q: str = Query(..., description="Recipe search query"),
     cuisine: CuisineType = Query(None, description="Cuisine type filter"),
     difficulty: DifficultyLevel = Query(None, description="Difficulty level filter"),
     max_time: int = Query(None, description="Maximum total time in minutes"),
     dietary: List[DietaryRestriction] = Query(None, description="Dietary restrictions"),
-) -> RecipeSearchResponse:
+) -> Response:
     """
     Quick recipe search with URL parameters.
 
@@ -206,8 +321,7 @@ async def quick_recipe_search(
         )
 
         # Use the main search endpoint logic
-        result: RecipeSearchResponse = await search_recipes(request)
-        return result
+        return await search_recipes(request)
 
     except Exception as e:
         logger.error(f"Error in quick recipe search: {e}")
@@ -0,0 +1,33 @@
+"""Static file serving for the frontend assets."""
+
+import os
+from typing import Any
+
+from fastapi.staticfiles import StaticFiles
+from starlette.responses import Response
+from starlette.types import Scope
+
+
+class CachedStaticFiles(StaticFiles):
+    """StaticFiles that lets browsers cache the assets it serves."""
+
+    def __init__(self, *, max_age: int, **kwargs: Any) -> None:
+        """Cache served files for max_age seconds."""
+        super().__init__(**kwargs)
+        self.cache_control = f"public, max-age={max_age}"
+
+    def file_response(
+        self,
+        full_path: os.PathLike[str] | str,
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        """Serve a file with a Cache-Control header."""
+        response = super().file_response(full_path, stat_result, scope, status_code)
+
+        # StaticFiles already sets ETag and answers If-None-Match with a 304,
+        # so once max-age runs out the browser revalidates instead of refetching
+        if status_code == 200:
+            response.headers["Cache-Control"] = self.cache_control
+        return response
@@ -34,6 +34,7 @@ class Settings(BaseSettings):
     api_port: int = Field(8000, alias="API_PORT")
     api_debug: bool = Field(False, alias="API_DEBUG")
     api_reload: bool = Field(True, alias="API_RELOAD")
+    static_cache_max_age: int = Field(3600, alias="STATIC_CACHE_MAX_AGE")
 
     # Security
     secret_key: str = Field("change-me-in-production", alias="SECRET_KEY")
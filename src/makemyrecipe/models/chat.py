@@ -4,7 +4,10 @@ from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 from uuid import uuid4
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, PrivateAttr, field_validator
+
+# Roles a chat message may have
+VALID_ROLES = frozenset(("user", "assistant", "system"))
 
 
 class ChatMessage(BaseModel):
@@ -32,9 +35,8 @@ class ChatMessage(BaseModel):
     @classmethod
     def validate_role(cls, v):
         """Validate message role."""
-        allowed_roles = {"user", "assistant", "system"}
-        if v not in allowed_roles:
-            raise ValueError(f"Role must be one of {allowed_roles}")
+        if v not in VALID_ROLES:
+            raise ValueError(f"Role must be one of {sorted(VALID_ROLES)}")
         return v
 
 
@@ -123,6 +125,13 @@ class Conversation(BaseModel):
     version: int = Field(1, description="Conversation schema version")
     checksum: Optional[str] = Field(None, description="Data integrity checksum")
 
+    # parent_message_id -> child messages, or None until the first thread lookup
+    _children: Optional[Dict[Optional[str], List[ChatMessage]]] = PrivateAttr(
+        default=None
+    )
+    # Serialized length in bytes, or None until first requested
+    _size_bytes: Optional[int] = PrivateAttr(default=None)
+
     def add_message(
         self,
         role: str,
@@ -139,8 +148,20 @@ class Conversation(BaseModel):
         )
         self.messages.append(message)
         self.updated_at = datetime.now(timezone.utc)
+        if self._children is not None:
+            self._children.setdefault(parent_message_id, []).append(message)
+        if self._size_bytes is not None:
+            # The message plus the comma separating it from the previous one
+            self._size_bytes += len(message.model_dump_json()) + (
+                len(self.messages) > 1
+            )
         return message
 
+    def invalidate_caches(self) -> None:
+        """Drop derived state after messages or metadata are edited in place."""
+        self._children = None
+        self._size_bytes = None
+
     def get_message_by_id(self, message_id: str) -> Optional[ChatMessage]:
         """Get a message by its ID."""
         for message in self.messages:
@@ -152,9 +173,13 @@ class Conversation(BaseModel):
         self, parent_message_id: Optional[str] = None
     ) -> List[ChatMessage]:
         """Get messages in a specific thread."""
-        return [
-            msg for msg in self.messages if msg.parent_message_id == parent_message_id
-        ]
+        # Index every message once, then let add_message keep it up to date
+        if self._children is None:
+            children: Dict[Optional[str], List[ChatMessage]] = {}
+            for msg in self.messages:
+                children.setdefault(msg.parent_message_id, []).append(msg)
+            self._children = children
+        return list(self._children.get(parent_message_id, ()))
 
     def get_message_count(self) -> int:
         """Get total message count."""
@@ -162,7 +187,10 @@ class Conversation(BaseModel):
 
     def get_size_estimate(self) -> int:
         """Estimate conversation size in bytes."""
-        return len(self.model_dump_json())
+        # Serialize once, then let add_message keep the count up to date
+        if self._size_bytes is None:
+            self._size_bytes = len(self.model_dump_json())
+        return self._size_bytes
 
     @field_validator("version")
     @classmethod
@@ -1,12 +1,14 @@
 """Recipe-related data models."""
 
+import re
 from datetime import datetime, timezone
+from functools import lru_cache
 
 # Import types at runtime to avoid circular imports
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 from uuid import uuid4
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 if TYPE_CHECKING:
     from ..services.recipe_service import (
@@ -18,18 +20,48 @@ if TYPE_CHECKING:
         RecipeSearchQuery,
     )
 
+# Optional scheme followed by "//" and the network location, as in urlsplit
+NETLOC_PATTERN = re.compile(r"(?:[A-Za-z][A-Za-z0-9+.-]*:)?//([^/?#]*)")
+
+
+@lru_cache(maxsize=1024)
+def extract_domain(url: str) -> str:
+    """Return the network location of a URL, matching ``urlparse(url).netloc``.
+
+    Results are cached since the same source URLs recur across AI responses.
+    """
+    match = NETLOC_PATTERN.match(url.lstrip())
+    return match.group(1) if match else ""
+
 
 class Citation(BaseModel):
     """Citation model for recipe sources."""
 
+    # Frozen so citations are hashable and can be deduplicated through a set
+    model_config = ConfigDict(frozen=True)
+
     title: str = Field(..., description="Title of the source")
     url: str = Field(..., description="URL of the source")
     snippet: Optional[str] = Field(None, description="Brief excerpt from the source")
-    domain: Optional[str] = Field(None, description="Domain of the source website")
+    # Keyword default so type checkers treat domain as optional; fill_domain
+    # sets it from the URL
+    domain: Optional[str] = Field(
+        default=None, description="Domain of the source website"
+    )
     published_date: Optional[str] = Field(
         None, description="Publication date if available"
     )
 
+    @model_validator(mode="before")
+    @classmethod
+    def fill_domain(cls, data: Any) -> Any:
+        """Derive a missing domain from the URL once, at construction."""
+        if isinstance(data, dict) and data.get("domain") is None:
+            url = data.get("url")
+            if url and isinstance(url, str):
+                data = {**data, "domain": extract_domain(url)}
+        return data
+
 
 class Recipe(BaseModel):
     """Enhanced Recipe model with comprehensive citation support."""
@@ -79,8 +111,9 @@ class Recipe(BaseModel):
         default_factory=lambda: datetime.now(timezone.utc),
         description="Creation timestamp",
     )
+    # Reuse the validated created_at rather than reading the clock again
     updated_at: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc),
+        default_factory=lambda data: data["created_at"],
         description="Last update timestamp",
     )
     search_query: Optional[str] = Field(
@@ -92,8 +125,9 @@ class Recipe(BaseModel):
         return [self.primary_source] + self.additional_sources
 
     def add_citation(self, citation: Citation) -> None:
-        """Add an additional citation to this recipe."""
-        if citation not in self.additional_sources:
+        """Add an additional citation unless one with the same URL exists."""
+        # Read the URLs from the current list so in-place edits are respected
+        if citation.url not in {source.url for source in self.additional_sources}:
             self.additional_sources.append(citation)
             self.updated_at = datetime.now(timezone.utc)
 
@@ -273,28 +307,10 @@ def convert_recipe_result_to_recipe(
     recipe_result: "RecipeResult", search_query: Optional[str] = None
 ) -> Recipe:
     """Convert RecipeResult to enhanced Recipe model."""
-    from urllib.parse import urlparse
-
-    # Import types and rebuild model if needed
-    try:
-        from ..services.recipe_service import (
-            CuisineType,
-            DietaryRestriction,
-            DifficultyLevel,
-        )
-
-        Recipe.model_rebuild()
-    except Exception:
-        pass  # Model may already be rebuilt
-
-    # Create primary citation
-    domain = (
-        urlparse(recipe_result.source_url).netloc if recipe_result.source_url else None
-    )
+    # Create primary citation; Citation derives the domain from the URL
     primary_source = Citation(
         title=recipe_result.source_name or "Unknown Source",
         url=recipe_result.source_url or "",
-        domain=domain,
     )
 
     return Recipe(
@@ -317,30 +333,21 @@ def convert_recipe_result_to_recipe(
     )
 
 
+def _citation_from_dict(citation_data: Dict[str, Any]) -> Citation:
+    """Build a Citation from one citation dictionary."""
+    title = citation_data.get("title", "")
+    return Citation(
+        title=title if title and title.strip() else "Unknown Source",
+        url=citation_data.get("url", ""),
+        snippet=citation_data.get("snippet"),
+    )
+
+
 def convert_citations_to_recipe_citations(
     citations: List[Dict[str, Any]],
 ) -> List[Citation]:
     """Convert citation dictionaries to Citation objects."""
-    from urllib.parse import urlparse
-
-    recipe_citations = []
-    for citation_data in citations:
-        title = citation_data.get("title", "")
-        if not title or title.strip() == "":
-            title = "Unknown Source"
-
-        url = citation_data.get("url", "")
-        domain = urlparse(url).netloc if url else None
-
-        citation = Citation(
-            title=title,
-            url=url,
-            snippet=citation_data.get("snippet"),
-            domain=domain,
-        )
-        recipe_citations.append(citation)
-
-    return recipe_citations
+    return [_citation_from_dict(citation_data) for citation_data in citations]
 
 
 class EnhancedRecipeSearchResponse(BaseModel):
@@ -350,3 +357,36 @@ class EnhancedRecipeSearchResponse(BaseModel):
     total_count: int = Field(..., description="Total number of recipes found")
     search_query: str = Field(..., description="Original search query")
     raw_response: Optional[str] = Field(None, description="Raw LLM response")
+
+
+@lru_cache(maxsize=None)
+def rebuild_recipe_models() -> None:
+    """Build the recipe models once the service enums are importable.
+
+    The enums live in ``services.recipe_service``, which cannot be imported here
+    at module load without a cycle, so the models stay incomplete until then.
+    The call is cached, so only the first one per process does any work.
+    """
+    from ..services.recipe_service import (
+        CuisineType,
+        DietaryRestriction,
+        DifficultyLevel,
+    )
+
+    namespace = {
+        "CuisineType": CuisineType,
+        "DietaryRestriction": DietaryRestriction,
+        "DifficultyLevel": DifficultyLevel,
+    }
+    for model in (
+        Recipe,
+        RecipeSearchRequest,
+        RecipeMetadataResponse,
+        RecipeResponse,
+        RecipeSearchResponse,
+        IngredientSuggestionRequest,
+        CuisineRecipeRequest,
+        RecipeRecommendationContext,
+        EnhancedRecipeSearchResponse,
+    ):
+        model.model_rebuild(_types_namespace=namespace)
@@ -15,6 +15,8 @@ from ..models.chat import ChatMessage
 
 logger = get_logger(__name__)
 
+SEARCH_TAG_PATTERN = re.compile(r"<search>(.*?)</search>", re.DOTALL | re.IGNORECASE)
+
 
 class AnthropicService:
     """Service for interacting with Anthropic Claude API with web search."""
@@ -102,14 +104,26 @@ class AnthropicService:
 
     def _extract_search_queries(self, text: str) -> List[str]:
         """Extract search queries from <search></search> tags."""
-        pattern = r"<search>(.*?)</search>"
-        matches = re.findall(pattern, text, re.DOTALL | re.IGNORECASE)
+        matches = SEARCH_TAG_PATTERN.findall(text)
         return [match.strip() for match in matches if match.strip()]
 
     def _remove_search_tags(self, text: str) -> str:
         """Remove search tags from text."""
-        pattern = r"<search>.*?</search>"
-        return re.sub(pattern, "", text, flags=re.DOTALL | re.IGNORECASE).strip()
+        return SEARCH_TAG_PATTERN.sub("", text).strip()
+
+    def _split_search_tags(self, text: str) -> Tuple[List[str], str]:
+        """Extract search queries and strip their tags in a single pass."""
+        queries: List[str] = []
+        pieces: List[str] = []
+        last_end = 0
+        for match in SEARCH_TAG_PATTERN.finditer(text):
+            query = match.group(1).strip()
+            if query:
+                queries.append(query)
+            pieces.append(text[last_end : match.start()])
+            last_end = match.end()
+        pieces.append(text[last_end:])
+        return queries, "".join(pieces).strip()
 
     async def _perform_search(self, query: str) -> Tuple[str, List[Dict[str, Any]]]:
         """Perform a web search using Anthropic's search API."""
@@ -184,7 +198,7 @@ class AnthropicService:
             initial_content, _ = self._extract_response_content(initial_response)
 
             # Check for search tags
-            search_queries = self._extract_search_queries(initial_content)
+            search_queries, cleaned_content = self._split_search_tags(initial_content)
             all_citations = []
             search_results_content = ""
 
@@ -201,9 +215,6 @@ class AnthropicService:
                     )
                     all_citations.extend(search_citations)
 
-                # Remove search tags from initial content
-                cleaned_content = self._remove_search_tags(initial_content)
-
                 # Generate final response with search results
                 final_messages = claude_messages + [
                     {"role": "assistant", "content": cleaned_content},
@@ -120,6 +120,7 @@ class ChatService:
         else:
             # Remove the message if save failed
             conversation.messages.pop()
+            conversation.invalidate_caches()
             return None
 
     def delete_conversation(self, conversation_id: str) -> bool:
@@ -199,6 +200,7 @@ class ChatService:
             conversation.metadata.cuisine_preferences = cuisine_preferences
         if dietary_restrictions is not None:
             conversation.metadata.dietary_restrictions = dietary_restrictions
+        conversation.invalidate_caches()
 
         conversation.updated_at = datetime.now(timezone.utc)
 
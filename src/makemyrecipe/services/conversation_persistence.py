@@ -3,15 +3,21 @@
 import gzip
 import hashlib
 import json
+import mmap
+import os
 import re
-import shutil
-from datetime import datetime, timezone
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+import orjson
 
 from ..core.config import settings
 from ..core.logging import get_logger
 from ..models.chat import (
+    VALID_ROLES,
     ChatMessage,
     Conversation,
     ConversationBackup,
@@ -21,6 +27,45 @@ from ..models.chat import (
 
 logger = get_logger(__name__)
 
+# orjson options for conversation files, which are written compactly since
+# they are only read by the service; naive datetimes are treated as UTC,
+# matching how they are interpreted on load.
+JSON_DUMP_OPTIONS = orjson.OPT_NAIVE_UTC
+
+# gzip's default level (9) spends most of the backup time compressing;
+# level 1 is several times faster for a slightly larger archive.
+BACKUP_COMPRESSION_LEVEL = 1
+
+# Backups smaller than this are stored without compression (gzip level 0);
+# deflating a few hundred bytes costs more than it saves.
+BACKUP_COMPRESSION_MIN_SIZE = 1024
+
+# Files at least this large are parsed from a memory map instead of being
+# read into an intermediate bytes object first.
+MMAP_THRESHOLD = 64 * 1024
+
+# Number of parsed and verified conversations kept by the load cache
+LOAD_CACHE_SIZE = 256
+
+# Fields that stored conversations and their messages must contain
+REQUIRED_CONVERSATION_FIELDS = (
+    "conversation_id",
+    "user_id",
+    "messages",
+    "created_at",
+    "updated_at",
+)
+REQUIRED_MESSAGE_FIELDS = ("role", "content", "timestamp")
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _to_epoch_ns(dt: datetime) -> int:
+    """Convert a datetime to integer nanoseconds since the epoch (naive as UTC)."""
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return (dt - _EPOCH) // timedelta(microseconds=1) * 1000
+
 
 class ConversationPersistenceService:
     """Advanced service for conversation persistence with backup/recovery/search."""
@@ -36,21 +81,57 @@ class ConversationPersistenceService:
         self.backup_path.mkdir(parents=True, exist_ok=True)
         self.temp_path.mkdir(parents=True, exist_ok=True)
 
-    def calculate_checksum(self, data: str) -> str:
+        # Search index: conversation_id -> filterable fields, tagged with the
+        # mtime/size of the file they were extracted from
+        self._search_index: Dict[str, Dict[str, Any]] = {}
+
+        # LRU cache: conversation_id -> (mtime_ns, size, verified conversation)
+        self._load_cache: "OrderedDict[str, Tuple[int, int, Conversation]]" = (
+            OrderedDict()
+        )
+
+    def calculate_checksum(self, data: Union[str, bytes]) -> str:
         """Calculate SHA-256 checksum for data integrity."""
-        return hashlib.sha256(data.encode("utf-8")).hexdigest()
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        return hashlib.sha256(data).hexdigest()
 
     def calculate_conversation_checksum(self, conversation: Conversation) -> str:
         """Calculate checksum for a conversation object."""
-        # Create a copy and remove checksum
-        temp_conversation = conversation.model_copy()
-        temp_conversation.checksum = None
-
-        # Serialize with consistent formatting
-        data = temp_conversation.model_dump()
-        json_data = json.dumps(data, sort_keys=True, separators=(",", ":"), default=str)
+        return self._calculate_dump_checksum(conversation.model_dump())
+
+    def _calculate_dump_checksum(self, data: Dict[str, Any]) -> str:
+        """Calculate the conversation checksum from its model_dump() output."""
+        # The checksum field itself is excluded from the hashed data
+        json_data = json.dumps(
+            {**data, "checksum": None},
+            sort_keys=True,
+            separators=(",", ":"),
+            default=str,
+        )
         return self.calculate_checksum(json_data)
 
+    def _iter_conversation_files(self) -> Iterator[Path]:
+        """Yield the stored conversation files in a single directory scan."""
+        with os.scandir(self.storage_path) as entries:
+            for entry in entries:
+                if (
+                    entry.name.endswith(".json")
+                    and not entry.name.startswith("backup_")
+                    and entry.is_file()
+                ):
+                    yield Path(entry.path)
+
+    def _read_json_file(self, file_path: Path) -> Any:
+        """Read and parse a JSON file, memory-mapping large files."""
+        with open(file_path, "rb") as f:
+            if file_path.stat().st_size < MMAP_THRESHOLD:
+                return orjson.loads(f.read())
+
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:
+                    return orjson.loads(view)
+
     def validate_conversation_data(
         self, data: Dict[str, Any]
     ) -> Tuple[bool, List[str]]:
@@ -58,14 +139,7 @@ class ConversationPersistenceService:
         errors = []
 
         # Check required fields
-        required_fields = [
-            "conversation_id",
-            "user_id",
-            "messages",
-            "created_at",
-            "updated_at",
-        ]
-        for field in required_fields:
+        for field in REQUIRED_CONVERSATION_FIELDS:
             if field not in data:
                 errors.append(f"Missing required field: {field}")
 
@@ -76,17 +150,12 @@ class ConversationPersistenceService:
                     errors.append(f"Message {i} is not a dictionary")
                     continue
 
-                msg_required = ["role", "content", "timestamp"]
-                for field in msg_required:
+                for field in REQUIRED_MESSAGE_FIELDS:
                     if field not in message:
                         errors.append(f"Message {i} missing field: {field}")
 
                 # Validate role
-                if "role" in message and message["role"] not in {
-                    "user",
-                    "assistant",
-                    "system",
-                }:
+                if "role" in message and message["role"] not in VALID_ROLES:
                     errors.append(f"Message {i} has invalid role: {message['role']}")
 
         # Validate version if present
@@ -97,40 +166,84 @@ class ConversationPersistenceService:
 
     def save_conversation_with_validation(self, conversation: Conversation) -> bool:
         """Save conversation with data validation and integrity checks."""
+        final_file = self._write_conversation_file(conversation)
+        if final_file is None:
+            return False
+        return self._record_saved_conversation(conversation, final_file)
+
+    def save_conversations_bulk(self, conversations: List[Conversation]) -> int:
+        """Save many conversations concurrently, returning how many were saved."""
+        # Later duplicates win, as they would when saving one at a time
+        unique = list({conv.conversation_id: conv for conv in conversations}.values())
+        if not unique:
+            return 0
+
+        # Only the serialize-and-write step is overlapped across threads; the
+        # load cache and search index are not thread-safe, so they are updated
+        # here on the calling thread once every write has finished
+        with ThreadPoolExecutor() as executor:
+            final_files = list(executor.map(self._write_conversation_file, unique))
+
+        return sum(
+            1
+            for conversation, final_file in zip(unique, final_files)
+            if final_file is not None
+            and self._record_saved_conversation(conversation, final_file)
+        )
+
+    def _write_conversation_file(self, conversation: Conversation) -> Optional[Path]:
+        """Validate and atomically write a conversation, returning its file."""
         try:
+            # Dump once and reuse it for the checksum, validation and the file
+            data = conversation.model_dump()
+
             # Calculate and store checksum
-            checksum = self.calculate_conversation_checksum(conversation)
+            checksum = self._calculate_dump_checksum(data)
             conversation.checksum = checksum
-
-            # Serialize conversation with checksum
-            data = conversation.model_dump()
-            json_data = json.dumps(data, indent=2, default=str)
+            data["checksum"] = checksum
 
             # Validate data structure
             is_valid, errors = self.validate_conversation_data(data)
             if not is_valid:
                 logger.error(f"Conversation validation failed: {errors}")
-                return False
+                return None
+
+            # Serialize conversation with checksum
+            json_data = orjson.dumps(data, option=JSON_DUMP_OPTIONS, default=str)
 
             # Write to temporary file first
             temp_file = self.temp_path / f"{conversation.conversation_id}.json.tmp"
-            with open(temp_file, "w", encoding="utf-8") as f:
+            with open(temp_file, "wb") as f:
                 f.write(json_data)
 
-            # Atomic move to final location
+            # Atomic rename to final location
             final_file = self.storage_path / f"{conversation.conversation_id}.json"
-            shutil.move(str(temp_file), str(final_file))
+            os.replace(temp_file, final_file)
 
             logger.debug(
                 f"Saved conversation {conversation.conversation_id} "
                 f"with checksum {checksum[:8]}..."
             )
-            return True
+            return final_file
 
         except Exception as e:
             logger.error(
                 f"Error saving conversation {conversation.conversation_id}: {e}"
             )
+            return None
+
+    def _record_saved_conversation(
+        self, conversation: Conversation, file_path: Path
+    ) -> bool:
+        """Drop the stale cached copy and index a freshly written conversation."""
+        try:
+            self._load_cache.pop(conversation.conversation_id, None)
+            self._update_search_index(conversation, file_path)
+            return True
+        except Exception as e:
+            logger.error(
+                f"Error indexing conversation {conversation.conversation_id}: {e}"
+            )
             return False
 
     def load_conversation_with_validation(
@@ -142,8 +255,14 @@ class ConversationPersistenceService:
             if not file_path.exists():
                 return None
 
-            with open(file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            # Reuse the previously verified conversation if the file is unchanged
+            stat = file_path.stat()
+            cached = self._load_cache.get(conversation_id)
+            if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+                self._load_cache.move_to_end(conversation_id)
+                return cached[2].model_copy(deep=True)
+
+            data = self._read_json_file(file_path)
 
             # Validate data structure
             is_valid, errors = self.validate_conversation_data(data)
@@ -154,11 +273,11 @@ class ConversationPersistenceService:
                 # Try to recover from backup
                 return self._recover_from_backup(conversation_id)
 
-            # Ensure timezone-aware datetimes
-            self._ensure_timezone_aware(data)
+            # Create conversation object; pydantic-core parses the timestamps
+            conversation = Conversation.model_validate(data)
 
-            # Create conversation object
-            conversation = Conversation(**data)
+            # Ensure timezone-aware datetimes
+            self._ensure_timezone_aware(conversation)
 
             # Verify checksum if present
             if conversation.checksum:
@@ -179,6 +298,14 @@ class ConversationPersistenceService:
                         # No backup available, return None for corrupted data
                         return None
 
+            self._load_cache[conversation_id] = (
+                stat.st_mtime_ns,
+                stat.st_size,
+                conversation.model_copy(deep=True),
+            )
+            if len(self._load_cache) > LOAD_CACHE_SIZE:
+                self._load_cache.popitem(last=False)
+
             return conversation
 
         except Exception as e:
@@ -186,25 +313,21 @@ class ConversationPersistenceService:
             # Try to recover from backup
             return self._recover_from_backup(conversation_id)
 
-    def _ensure_timezone_aware(self, data: dict) -> None:
-        """Ensure datetime fields are timezone-aware."""
-        for field in ["created_at", "updated_at"]:
-            if field in data and isinstance(data[field], str):
-                dt = datetime.fromisoformat(data[field].replace("Z", "+00:00"))
-                if dt.tzinfo is None:
-                    dt = dt.replace(tzinfo=timezone.utc)
-                data[field] = dt
+    def _ensure_timezone_aware(self, conversation: Conversation) -> None:
+        """Ensure datetime fields are timezone-aware, treating naive ones as UTC."""
+        if conversation.created_at.tzinfo is None:
+            conversation.created_at = conversation.created_at.replace(
+                tzinfo=timezone.utc
+            )
+        if conversation.updated_at.tzinfo is None:
+            conversation.updated_at = conversation.updated_at.replace(
+                tzinfo=timezone.utc
+            )
 
         # Handle messages
-        if "messages" in data:
-            for message in data["messages"]:
-                if "timestamp" in message and isinstance(message["timestamp"], str):
-                    dt = datetime.fromisoformat(
-                        message["timestamp"].replace("Z", "+00:00")
-                    )
-                    if dt.tzinfo is None:
-                        dt = dt.replace(tzinfo=timezone.utc)
-                    message["timestamp"] = dt
+        for message in conversation.messages:
+            if message.timestamp.tzinfo is None:
+                message.timestamp = message.timestamp.replace(tzinfo=timezone.utc)
 
     def create_backup(
         self, user_id: Optional[str] = None
@@ -217,27 +340,24 @@ class ConversationPersistenceService:
 
             backup_file = self.backup_path / f"{backup_id}.json.gz"
 
-            # Collect conversations to backup
-            conversations = []
+            # Collect the raw JSON of each conversation to backup, reading the
+            # files concurrently; sorting keeps the backup order deterministic
+            file_paths = sorted(self._iter_conversation_files())
+            with ThreadPoolExecutor() as executor:
+                file_contents = list(
+                    executor.map(self._read_backup_candidate, file_paths)
+                )
+
+            conversations: List[bytes] = []
             total_size = 0
 
-            for file_path in self.storage_path.glob("*.json"):
-                if file_path.name.startswith("backup_"):
+            for raw_data, data in filter(None, file_contents):
+                # Filter by user_id if specified
+                if user_id and data.get("user_id") != user_id:
                     continue
 
-                try:
-                    with open(file_path, "r", encoding="utf-8") as f:
-                        data = json.load(f)
-
-                    # Filter by user_id if specified
-                    if user_id and data.get("user_id") != user_id:
-                        continue
-
-                    conversations.append(data)
-                    total_size += file_path.stat().st_size
-
-                except Exception as e:
-                    logger.warning(f"Skipping corrupted file {file_path}: {e}")
+                conversations.append(raw_data)
+                total_size += len(raw_data)
 
             if not conversations:
                 logger.info("No conversations to backup")
@@ -247,7 +367,6 @@ class ConversationPersistenceService:
             backup_data = {
                 "backup_id": backup_id,
                 "created_at": datetime.now(timezone.utc).isoformat(),
-                "conversations": conversations,
                 "metadata": {
                     "user_id": user_id,
                     "conversation_count": len(conversations),
@@ -255,11 +374,24 @@ class ConversationPersistenceService:
                 },
             }
 
-            # Serialize and compress
-            json_data = json.dumps(backup_data, default=str)
+            # Serialize, splicing the stored conversation JSON in verbatim
+            # instead of re-encoding it
+            json_data = b"".join(
+                [
+                    orjson.dumps(backup_data)[:-1],
+                    b',"conversations":[',
+                    b",".join(conversations),
+                    b"]}",
+                ]
+            )
             checksum = self.calculate_checksum(json_data)
 
-            with gzip.open(backup_file, "wt", encoding="utf-8") as f:
+            compresslevel = (
+                BACKUP_COMPRESSION_LEVEL
+                if len(json_data) >= BACKUP_COMPRESSION_MIN_SIZE
+                else 0
+            )
+            with gzip.open(backup_file, "wb", compresslevel=compresslevel) as f:
                 f.write(json_data)
 
             # Create backup metadata
@@ -279,6 +411,17 @@ class ConversationPersistenceService:
             logger.error(f"Error creating backup: {e}")
             return None
 
+    def _read_backup_candidate(
+        self, file_path: Path
+    ) -> Optional[Tuple[bytes, Dict[str, Any]]]:
+        """Read a conversation file for backup as raw bytes and parsed data."""
+        try:
+            raw_data = file_path.read_bytes()
+            return raw_data, orjson.loads(raw_data)
+        except Exception as e:
+            logger.warning(f"Skipping corrupted file {file_path}: {e}")
+            return None
+
     def restore_from_backup(
         self, backup_id: str, user_id: Optional[str] = None
     ) -> bool:
@@ -290,8 +433,8 @@ class ConversationPersistenceService:
                 return False
 
             # Load and decompress backup
-            with gzip.open(backup_file, "rt", encoding="utf-8") as f:
-                backup_data = json.load(f)
+            with gzip.open(backup_file, "rb") as f:
+                backup_data = orjson.loads(f.read())
 
             # Verify backup integrity
             conversations = backup_data.get("conversations", [])
@@ -299,7 +442,7 @@ class ConversationPersistenceService:
                 logger.error(f"No conversations found in backup {backup_id}")
                 return False
 
-            restored_count = 0
+            to_restore = []
             for conv_data in conversations:
                 try:
                     # Filter by user_id if specified
@@ -312,17 +455,17 @@ class ConversationPersistenceService:
                         logger.warning(f"Skipping invalid conversation: {errors}")
                         continue
 
-                    # Ensure timezone-aware datetimes
-                    self._ensure_timezone_aware(conv_data)
+                    # Create conversation with timezone-aware datetimes
+                    conversation = Conversation.model_validate(conv_data)
+                    self._ensure_timezone_aware(conversation)
 
-                    # Create and save conversation
-                    conversation = Conversation(**conv_data)
-                    if self.save_conversation_with_validation(conversation):
-                        restored_count += 1
+                    to_restore.append(conversation)
 
                 except Exception as e:
                     logger.warning(f"Error restoring conversation: {e}")
 
+            restored_count = self.save_conversations_bulk(to_restore)
+
             logger.info(
                 f"Restored {restored_count} conversations from backup {backup_id}"
             )
@@ -342,8 +485,8 @@ class ConversationPersistenceService:
 
             for backup_file in backup_files:
                 try:
-                    with gzip.open(backup_file, "rt", encoding="utf-8") as f:
-                        backup_data = json.load(f)
+                    with gzip.open(backup_file, "rb") as f:
+                        backup_data = orjson.loads(f.read())
 
                     conversations = backup_data.get("conversations", [])
                     for conv_data in conversations:
@@ -353,12 +496,13 @@ class ConversationPersistenceService:
                                 conv_data
                             )
                             if is_valid:
-                                self._ensure_timezone_aware(conv_data)
+                                conversation = Conversation.model_validate(conv_data)
+                                self._ensure_timezone_aware(conversation)
                                 logger.info(
                                     f"Recovered conversation {conversation_id} "
                                     f"from backup"
                                 )
-                                return Conversation(**conv_data)
+                                return conversation
 
                 except Exception as e:
                     logger.warning(f"Error reading backup {backup_file}: {e}")
@@ -381,23 +525,34 @@ class ConversationPersistenceService:
         try:
             results = []
 
-            for file_path in self.storage_path.glob("*.json"):
-                if file_path.name.startswith("backup_"):
-                    continue
+            # Date bounds are compared as integers against the index
+            date_from_ns = _to_epoch_ns(query.date_from) if query.date_from else None
+            date_to_ns = _to_epoch_ns(query.date_to) if query.date_to else None
 
+            seen_ids = set()
+
+            for file_path in self._iter_conversation_files():
+                seen_ids.add(file_path.stem)
                 try:
-                    conversation = self.load_conversation_with_validation(
-                        file_path.stem
-                    )
-                    if not conversation:
+                    entry = self._get_search_index_entry(file_path)
+                    if not entry:
                         continue
 
                     # Filter by user_id
-                    if conversation.user_id != query.user_id:
+                    if entry["user_id"] != query.user_id:
                         continue
 
                     # Apply filters
-                    if not self._matches_filters(conversation, query):
+                    if not self._matches_filters(
+                        entry, query, date_from_ns, date_to_ns
+                    ):
+                        continue
+
+                    # Only matching candidates are fully loaded
+                    conversation = self.load_conversation_with_validation(
+                        file_path.stem
+                    )
+                    if not conversation:
                         continue
 
                     # Calculate relevance score
@@ -416,6 +571,10 @@ class ConversationPersistenceService:
                 except Exception as e:
                     logger.warning(f"Error processing conversation {file_path}: {e}")
 
+            # Drop index entries for conversations removed from storage
+            for conversation_id in set(self._search_index) - seen_ids:
+                del self._search_index[conversation_id]
+
             # Sort by relevance score
             results.sort(key=lambda x: x.relevance_score, reverse=True)
 
@@ -428,25 +587,65 @@ class ConversationPersistenceService:
             logger.error(f"Error searching conversations: {e}")
             return []
 
+    def _update_search_index(
+        self, conversation: Conversation, file_path: Path
+    ) -> Dict[str, Any]:
+        """Record the filterable fields of a stored conversation."""
+        stat = file_path.stat()
+        entry = {
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "user_id": conversation.user_id,
+            "created_at_ns": _to_epoch_ns(conversation.created_at),
+            "tags": list(conversation.metadata.tags),
+            "cuisine_preferences": list(conversation.metadata.cuisine_preferences),
+            "dietary_restrictions": list(conversation.metadata.dietary_restrictions),
+        }
+        self._search_index[conversation.conversation_id] = entry
+        return entry
+
+    def _get_search_index_entry(self, file_path: Path) -> Optional[Dict[str, Any]]:
+        """Get the search index entry for a file, refreshing it if stale."""
+        conversation_id = file_path.stem
+        entry = self._search_index.get(conversation_id)
+        if entry:
+            stat = file_path.stat()
+            if entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+                return entry
+
+        conversation = self.load_conversation_with_validation(conversation_id)
+        if not conversation:
+            self._search_index.pop(conversation_id, None)
+            return None
+
+        return self._update_search_index(conversation, file_path)
+
     def _matches_filters(
-        self, conversation: Conversation, query: ConversationSearchQuery
+        self,
+        entry: Dict[str, Any],
+        query: ConversationSearchQuery,
+        date_from_ns: Optional[int],
+        date_to_ns: Optional[int],
     ) -> bool:
-        """Check if conversation matches filter criteria."""
+        """Check if a search index entry matches filter criteria.
+
+        Date bounds are passed precomputed as epoch nanoseconds.
+        """
         # Date range filter
-        if query.date_from and conversation.created_at < query.date_from:
+        if date_from_ns is not None and entry["created_at_ns"] < date_from_ns:
             return False
-        if query.date_to and conversation.created_at > query.date_to:
+        if date_to_ns is not None and entry["created_at_ns"] > date_to_ns:
             return False
 
         # Tags filter
         if query.tags:
-            if not any(tag in conversation.metadata.tags for tag in query.tags):
+            if not any(tag in entry["tags"] for tag in query.tags):
                 return False
 
         # Cuisine preferences filter
         if query.cuisine_preferences:
             if not any(
-                cuisine in conversation.metadata.cuisine_preferences
+                cuisine in entry["cuisine_preferences"]
                 for cuisine in query.cuisine_preferences
             ):
                 return False
@@ -454,7 +653,7 @@ class ConversationPersistenceService:
         # Dietary restrictions filter
         if query.dietary_restrictions:
             if not any(
-                restriction in conversation.metadata.dietary_restrictions
+                restriction in entry["dietary_restrictions"]
                 for restriction in query.dietary_restrictions
             ):
                 return False
@@ -511,17 +710,13 @@ class ConversationPersistenceService:
             }
 
             # Count conversation files
-            for file_path in self.storage_path.glob("*.json"):
-                if file_path.name.startswith("backup_"):
-                    continue
-
+            for file_path in self._iter_conversation_files():
                 try:
                     stats["total_size"] += file_path.stat().st_size
                     stats["total_conversations"] += 1
 
                     # Count messages
-                    with open(file_path, "r", encoding="utf-8") as f:
-                        data = json.load(f)
+                    data = self._read_json_file(file_path)
 
                     if "messages" in data:
                         stats["total_messages"] += len(data["messages"])
@@ -1,5 +1,6 @@
 """LLM service for generating chat responses."""
 
+import re
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, cast
 
 from ..core.config import settings
@@ -19,6 +20,39 @@ litellm_module: Any = litellm
 
 logger = get_logger(__name__)
 
+# Words that mark a message as recipe-related, matched anywhere in the text
+RECIPE_KEYWORDS = (
+    "recipe",
+    "cook",
+    "cooking",
+    "bake",
+    "baking",
+    "make",
+    "prepare",
+    "ingredient",
+    "ingredients",
+    "dish",
+    "meal",
+    "food",
+    "cuisine",
+    "how to cook",
+    "how to make",
+    "how to bake",
+    "dinner",
+    "lunch",
+    "breakfast",
+    "dessert",
+    "appetizer",
+    "snack",
+    "vegetarian",
+    "vegan",
+)
+
+# All keywords in one case-insensitive pattern, so a message is scanned once
+RECIPE_KEYWORD_PATTERN = re.compile(
+    "|".join(map(re.escape, RECIPE_KEYWORDS)), re.IGNORECASE
+)
+
 
 class LLMService:
     """Service for generating LLM responses."""
@@ -122,35 +156,7 @@ class LLMService:
         if not messages:
             return False
 
-        last_message = messages[-1].content.lower()
-        recipe_keywords = [
-            "recipe",
-            "cook",
-            "cooking",
-            "bake",
-            "baking",
-            "make",
-            "prepare",
-            "ingredient",
-            "ingredients",
-            "dish",
-            "meal",
-            "food",
-            "cuisine",
-            "how to cook",
-            "how to make",
-            "how to bake",
-            "dinner",
-            "lunch",
-            "breakfast",
-            "dessert",
-            "appetizer",
-            "snack",
-            "vegetarian",
-            "vegan",
-        ]
-
-        return any(keyword in last_message for keyword in recipe_keywords)
+        return RECIPE_KEYWORD_PATTERN.search(messages[-1].content) is not None
 
     async def _generate_with_litellm(
         self, messages: List[ChatMessage], system_prompt: Optional[str] = None
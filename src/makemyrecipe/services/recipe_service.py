@@ -8,6 +8,7 @@ from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 from ..core.config import settings
 from ..core.logging import get_logger
 from ..models.chat import ChatMessage
+from ..models.recipe import rebuild_recipe_models
 from .anthropic_service import anthropic_service
 
 if TYPE_CHECKING:
@@ -576,3 +577,6 @@ class RecipeService:
 
 # Global recipe service instance
 recipe_service = RecipeService()
+
+# The recipe models annotate fields with the enums above
+rebuild_recipe_models()
@@ -1,16 +1,63 @@
 """Pytest configuration and fixtures for MakeMyRecipe tests."""
 
 import os
+import re
 import tempfile
+from collections import OrderedDict
 from pathlib import Path
 from typing import Generator
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from fastapi.testclient import TestClient
 
-from makemyrecipe.api.main import create_app
 from makemyrecipe.core.config import Settings
 
+try:
+    import uvloop
+except ImportError:  # uvloop ships with uvicorn[standard], but not on Windows
+    uvloop = None
+
+# Run the shared TestClient's portal on uvloop when it is available
+_PORTAL_BACKEND_OPTIONS = {"use_uvloop": uvloop is not None}
+
+# Requested once before the shared client is handed out, so the first test
+# does not pay for routing and middleware setup
+_WARMUP_PATHS = ("/", "/api", "/health")
+
+# A deferred or async script, or scripts placed at the very end of <body>
+_NON_BLOCKING_SCRIPT_RE = re.compile(
+    rb"<script\b[^>]*\b(?:defer|async)\b"
+    rb"|(?:<script\b[^>]*>[^<]*</script>\s*)+</body>"
+)
+
+# Fixtures that build or patch the application; tests marked no_app may not
+# request any of them, directly or through another fixture
+_APP_FIXTURES = frozenset(
+    {
+        "client",
+        "app_client",
+        "html_bytes",
+        "css_bytes",
+        "js_bytes",
+        "scripts_non_blocking",
+        "mock_recipe_service",
+    }
+)
+
+
+def pytest_collection_modifyitems(items: list) -> None:
+    """Reject tests marked no_app that still pull in application fixtures."""
+    # Checked once at collection time, so unmarked tests pay nothing per run
+    for item in items:
+        if item.get_closest_marker("no_app") is None:
+            continue
+        used = sorted(_APP_FIXTURES.intersection(getattr(item, "fixturenames", ())))
+        if used:
+            raise pytest.UsageError(
+                f"{item.nodeid} is marked no_app but requests {', '.join(used)}"
+            )
+
 
 @pytest.fixture(scope="session")
 def test_settings() -> Settings:
@@ -41,11 +88,71 @@ def test_settings() -> Settings:
 @pytest.fixture
 def client(test_settings: Settings) -> Generator[TestClient, None, None]:
     """Create a test client for the FastAPI application."""
+    # Imported here so tests marked no_app never load the application
+    from makemyrecipe.api.main import create_app
+
     app = create_app()
     with TestClient(app) as test_client:
         yield test_client
 
 
+@pytest.fixture(scope="session")
+def app_client() -> Generator[TestClient, None, None]:
+    """Create one started-up test client shared by the whole session."""
+    from src.makemyrecipe.api.main import app as src_app
+
+    # The test modules import and patch src.makemyrecipe, so serve that copy of
+    # the app; patches on the makemyrecipe copy would never reach it
+    with TestClient(
+        src_app,
+        backend="asyncio",
+        backend_options=_PORTAL_BACKEND_OPTIONS,
+        raise_server_exceptions=True,
+    ) as test_client:
+        for path in _WARMUP_PATHS:
+            test_client.get(path)
+        yield test_client
+
+
+@pytest.fixture(scope="session")
+def html_bytes(app_client: TestClient) -> bytes:
+    """Fetch the index page once for the content checks."""
+    return app_client.get("/").content
+
+
+@pytest.fixture(scope="session")
+def css_bytes(app_client: TestClient) -> bytes:
+    """Fetch the stylesheet once for the content checks."""
+    return app_client.get("/static/css/styles.css").content
+
+
+@pytest.fixture(scope="session")
+def js_bytes(app_client: TestClient) -> bytes:
+    """Fetch the application script once for the content checks."""
+    return app_client.get("/static/js/app.js").content
+
+
+@pytest.fixture(scope="session")
+def scripts_non_blocking(html_bytes: bytes) -> bool:
+    """Check once whether the index page's scripts stay off the render path."""
+    return _NON_BLOCKING_SCRIPT_RE.search(html_bytes) is not None
+
+
+@pytest.fixture
+def mock_recipe_service(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """Replace the recipe routes' service singleton with a mock."""
+    mock_service = MagicMock()
+    mock_service.search_recipes_enhanced = AsyncMock()
+    monkeypatch.setattr(
+        "src.makemyrecipe.api.routes.recipe.recipe_service", mock_service
+    )
+    # Start from an empty response cache so earlier tests' results never leak in
+    monkeypatch.setattr(
+        "src.makemyrecipe.api.routes.recipe._enhanced_search_cache", OrderedDict()
+    )
+    return mock_service
+
+
 @pytest.fixture
 def sample_conversation_data() -> dict:
     """Sample conversation data for testing."""
@@ -1,10 +1,26 @@
 """Tests for chat API endpoints."""
 
+import orjson
 import pytest
 from fastapi.testclient import TestClient
 
 from makemyrecipe.models.chat import ChatRequest, Conversation
 
+# Request bodies that never change are serialized once at import time.
+JSON_HEADERS = {"content-type": "application/json"}
+PASTA_REQUEST_BODY = orjson.dumps(
+    {"message": "I want to make pasta", "user_id": "test_user_123"}
+)
+INVALID_CONVERSATION_REQUEST_BODY = orjson.dumps(
+    {
+        "message": "Hello",
+        "user_id": "test_user_123",
+        "conversation_id": "non_existent_id",
+    }
+)
+MISSING_MESSAGE_REQUEST_BODY = orjson.dumps({"user_id": "test_user_123"})
+MISSING_USER_ID_REQUEST_BODY = orjson.dumps({"message": "Hello"})
+
 
 def test_health_check(client: TestClient) -> None:
     """Test the health check endpoint."""
@@ -29,9 +45,9 @@ def test_root_endpoint(client: TestClient) -> None:
 
 def test_send_chat_message_new_conversation(client: TestClient) -> None:
     """Test sending a chat message to create a new conversation."""
-    request_data = {"message": "I want to make pasta", "user_id": "test_user_123"}
-
-    response = client.post("/api/chat", json=request_data)
+    response = client.post(
+        "/api/chat", content=PASTA_REQUEST_BODY, headers=JSON_HEADERS
+    )
     assert response.status_code == 200
 
     data = response.json()
@@ -44,9 +60,9 @@ def test_send_chat_message_new_conversation(client: TestClient) -> None:
 def test_send_chat_message_existing_conversation(client: TestClient) -> None:
     """Test sending a chat message to an existing conversation."""
     # First, create a conversation
-    request_data = {"message": "I want to make pasta", "user_id": "test_user_123"}
-
-    response = client.post("/api/chat", json=request_data)
+    response = client.post(
+        "/api/chat", content=PASTA_REQUEST_BODY, headers=JSON_HEADERS
+    )
     assert response.status_code == 200
     conversation_id = response.json()["conversation_id"]
 
@@ -66,13 +82,9 @@ def test_send_chat_message_existing_conversation(client: TestClient) -> None:
 
 def test_send_chat_message_invalid_conversation(client: TestClient) -> None:
     """Test sending a chat message to a non-existent conversation."""
-    request_data = {
-        "message": "Hello",
-        "user_id": "test_user_123",
-        "conversation_id": "non_existent_id",
-    }
-
-    response = client.post("/api/chat", json=request_data)
+    response = client.post(
+        "/api/chat", content=INVALID_CONVERSATION_REQUEST_BODY, headers=JSON_HEADERS
+    )
     assert response.status_code == 404
 
 
@@ -174,16 +186,19 @@ def test_delete_nonexistent_conversation(client: TestClient) -> None:
 def test_chat_message_validation(client: TestClient) -> None:
     """Test chat message validation."""
     # Missing message
-    request_data = {"user_id": "test_user_123"}
-    response = client.post("/api/chat", json=request_data)
+    response = client.post(
+        "/api/chat", content=MISSING_MESSAGE_REQUEST_BODY, headers=JSON_HEADERS
+    )
     assert response.status_code == 422
 
     # Missing user_id
-    request_data = {"message": "Hello"}
-    response = client.post("/api/chat", json=request_data)
+    response = client.post(
+        "/api/chat", content=MISSING_USER_ID_REQUEST_BODY, headers=JSON_HEADERS
+    )
     assert response.status_code == 422
 
 
+@pytest.mark.no_app
 def test_conversation_with_system_prompt(sample_conversation_data: dict) -> None:
     """Test that the sample conversation data includes system prompt."""
     assert "system_prompt" in sample_conversation_data
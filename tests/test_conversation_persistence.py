@@ -62,6 +62,11 @@ def test_calculate_checksum(temp_persistence_service):
     different_checksum = temp_persistence_service.calculate_checksum("different data")
     assert checksum1 != different_checksum
 
+    # Bytes are hashed directly and match the encoded string
+    assert temp_persistence_service.calculate_checksum(data.encode("utf-8")) == (
+        checksum1
+    )
+
 
 def test_validate_conversation_data(temp_persistence_service):
     """Test conversation data validation."""
@@ -132,6 +137,75 @@ def test_save_and_load_conversation(temp_persistence_service, sample_conversatio
     assert loaded_conversation.checksum is not None
 
 
+def test_save_and_load_large_conversation(temp_persistence_service):
+    """Test loading a conversation large enough to be memory-mapped."""
+    conversation = Conversation(user_id="test_user")
+    conversation.add_message("user", "pasta " * 20000)
+    assert temp_persistence_service.save_conversation_with_validation(conversation)
+
+    file_path = (
+        temp_persistence_service.storage_path / f"{conversation.conversation_id}.json"
+    )
+    assert file_path.stat().st_size >= 64 * 1024
+
+    loaded_conversation = temp_persistence_service.load_conversation_with_validation(
+        conversation.conversation_id
+    )
+    assert loaded_conversation is not None
+    assert loaded_conversation.messages[0].content == "pasta " * 20000
+
+
+def test_load_conversation_uses_cache(temp_persistence_service, sample_conversation):
+    """Test that unchanged conversation files are not parsed again."""
+    temp_persistence_service.save_conversation_with_validation(sample_conversation)
+    conversation_id = sample_conversation.conversation_id
+
+    first = temp_persistence_service.load_conversation_with_validation(conversation_id)
+    with patch.object(temp_persistence_service, "_read_json_file") as mock_read:
+        second = temp_persistence_service.load_conversation_with_validation(
+            conversation_id
+        )
+    mock_read.assert_not_called()
+    assert second == first
+    assert second is not first
+
+    # Changes made by the caller do not leak into the cache
+    second.messages.clear()
+    third = temp_persistence_service.load_conversation_with_validation(conversation_id)
+    assert len(third.messages) == 2
+
+    # Saving invalidates the cached entry
+    sample_conversation.add_message("user", "Can I use gluten-free pasta?")
+    temp_persistence_service.save_conversation_with_validation(sample_conversation)
+    fourth = temp_persistence_service.load_conversation_with_validation(conversation_id)
+    assert len(fourth.messages) == 3
+
+
+def test_load_conversation_with_naive_timestamps(temp_persistence_service):
+    """Test that naive timestamps on disk are loaded as UTC."""
+    data = {
+        "conversation_id": "naive_conv",
+        "user_id": "test_user",
+        "messages": [
+            {"role": "user", "content": "Hello", "timestamp": "2023-01-01T00:00:05"}
+        ],
+        "created_at": "2023-01-01T00:00:00",
+        "updated_at": "2023-01-01T00:00:05Z",
+    }
+    file_path = temp_persistence_service.storage_path / "naive_conv.json"
+    file_path.write_text(json.dumps(data), encoding="utf-8")
+
+    conversation = temp_persistence_service.load_conversation_with_validation(
+        "naive_conv"
+    )
+    assert conversation is not None
+    assert conversation.created_at == datetime(2023, 1, 1, tzinfo=timezone.utc)
+    assert conversation.updated_at.utcoffset() == timedelta(0)
+    assert conversation.messages[0].timestamp == datetime(
+        2023, 1, 1, 0, 0, 5, tzinfo=timezone.utc
+    )
+
+
 def test_load_nonexistent_conversation(temp_persistence_service):
     """Test loading a non-existent conversation."""
     result = temp_persistence_service.load_conversation_with_validation(
@@ -157,7 +231,7 @@ def test_checksum_verification(temp_persistence_service, sample_conversation):
     data["messages"][0]["content"] = "Corrupted content"
 
     with open(file_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, default=str)
+        json.dump(data, f, separators=(",", ":"), default=str)
 
     # Loading should detect corruption and try to recover from backup
     # Since no backup exists, it should return None
@@ -191,6 +265,19 @@ def test_create_backup(temp_persistence_service, sample_conversation):
     assert backup_file.exists()
 
 
+def test_create_backup_skips_corrupted_files(
+    temp_persistence_service, sample_conversation
+):
+    """Test that unreadable conversation files are left out of backups."""
+    temp_persistence_service.save_conversation_with_validation(sample_conversation)
+    corrupted_file = temp_persistence_service.storage_path / "corrupted.json"
+    corrupted_file.write_text("invalid json content", encoding="utf-8")
+
+    backup = temp_persistence_service.create_backup()
+    assert backup is not None
+    assert backup.conversation_count == 1
+
+
 def test_create_user_specific_backup(temp_persistence_service, sample_conversation):
     """Test creating user-specific backups."""
     # Save conversations for different users
@@ -233,6 +320,31 @@ def test_restore_from_backup(temp_persistence_service, sample_conversation):
     assert loaded_conversation.user_id == sample_conversation.user_id
 
 
+def test_save_conversations_bulk(temp_persistence_service):
+    """Test saving several conversations in one call."""
+    conversations = []
+    for i in range(5):
+        conversation = Conversation(user_id="test_user")
+        conversation.add_message("user", f"Recipe request {i}")
+        conversations.append(conversation)
+
+    saved_count = temp_persistence_service.save_conversations_bulk(conversations)
+    assert saved_count == 5
+
+    # Every saved conversation is indexed once the bulk save returns
+    conversation_ids = {conv.conversation_id for conv in conversations}
+    assert conversation_ids <= set(temp_persistence_service._search_index)
+
+    for conversation in conversations:
+        loaded = temp_persistence_service.load_conversation_with_validation(
+            conversation.conversation_id
+        )
+        assert loaded is not None
+        assert loaded.messages[0].content == conversation.messages[0].content
+
+    assert temp_persistence_service.save_conversations_bulk([]) == 0
+
+
 def test_search_conversations(temp_persistence_service):
     """Test conversation search functionality."""
     # Create test conversations
@@ -281,6 +393,35 @@ def test_search_conversations(temp_persistence_service):
     assert len(results) == 1
 
 
+def test_search_uses_index_for_filters(temp_persistence_service):
+    """Test that filtering uses the search index instead of loading files."""
+    conv1 = Conversation(user_id="test_user")
+    conv1.add_message("user", "I want to make pasta")
+    conv1.metadata.tags = ["pasta"]
+    temp_persistence_service.save_conversation_with_validation(conv1)
+
+    conv2 = Conversation(user_id="other_user")
+    conv2.add_message("user", "I want to make pasta too")
+    temp_persistence_service.save_conversation_with_validation(conv2)
+
+    # Only the matching conversation is loaded in full
+    query = ConversationSearchQuery(user_id="test_user", query="pasta")
+    with patch.object(
+        temp_persistence_service,
+        "load_conversation_with_validation",
+        wraps=temp_persistence_service.load_conversation_with_validation,
+    ) as mock_load:
+        results = temp_persistence_service.search_conversations(query)
+    assert len(results) == 1
+    mock_load.assert_called_once_with(conv1.conversation_id)
+
+    # Saving updated metadata refreshes the index
+    conv1.metadata.tags = ["risotto"]
+    temp_persistence_service.save_conversation_with_validation(conv1)
+    query = ConversationSearchQuery(user_id="test_user", tags=["pasta"])
+    assert temp_persistence_service.search_conversations(query) == []
+
+
 def test_search_with_date_filter(temp_persistence_service):
     """Test search with date filtering."""
     # Create conversation with specific date
@@ -347,6 +488,29 @@ def test_cleanup_old_backups(temp_persistence_service):
     assert len(remaining_files) == 10
 
 
+def test_small_backup_stored_uncompressed(temp_persistence_service):
+    """Test that tiny backups are written as stored (level 0) gzip."""
+    conversation = Conversation(user_id="u", system_prompt="s")
+    temp_persistence_service.save_conversation_with_validation(conversation)
+
+    backup = temp_persistence_service.create_backup()
+    assert backup is not None
+
+    raw = (
+        temp_persistence_service.backup_path / f"{backup.backup_id}.json.gz"
+    ).read_bytes()
+    payload = gzip.decompress(raw)
+    assert len(payload) < 1024
+    assert json.loads(payload)["conversations"][0]["user_id"] == "u"
+
+    # Level 0 writes stored deflate blocks, so the payload appears verbatim
+    assert payload in raw
+    assert len(raw) > len(payload)
+
+    # Stored backups are still restorable
+    assert temp_persistence_service.restore_from_backup(backup.backup_id)
+
+
 def test_recovery_from_backup(temp_persistence_service, sample_conversation):
     """Test automatic recovery from backup when file is corrupted."""
     # Save conversation and create backup
@@ -389,6 +553,41 @@ def test_conversation_threading(sample_conversation):
     root_messages = sample_conversation.get_thread_messages(None)
     assert len(root_messages) == 2  # Original 2 messages have no parent
 
+    # Messages added after the first lookup are included
+    second_reply = sample_conversation.add_message(
+        "user", "Thanks!", parent_message_id=parent_message.message_id
+    )
+    thread_messages = sample_conversation.get_thread_messages(parent_message.message_id)
+    assert [msg.message_id for msg in thread_messages] == [
+        threaded_message.message_id,
+        second_reply.message_id,
+    ]
+
+    # Messages removed outside add_message are dropped after invalidation
+    sample_conversation.messages.pop()
+    sample_conversation.invalidate_caches()
+    thread_messages = sample_conversation.get_thread_messages(parent_message.message_id)
+    assert len(thread_messages) == 1
+
+    # Messages replaced in place are picked up
+    replacement = ChatMessage(
+        role="assistant",
+        content="Replacement reply",
+        parent_message_id=parent_message.message_id,
+    )
+    sample_conversation.messages[1] = replacement
+    sample_conversation.invalidate_caches()
+    thread_messages = sample_conversation.get_thread_messages(parent_message.message_id)
+    assert replacement in thread_messages
+    assert replacement not in sample_conversation.get_thread_messages(None)
+
+    # Re-parenting an existing message is picked up
+    threaded_message.parent_message_id = None
+    sample_conversation.invalidate_caches()
+    thread_messages = sample_conversation.get_thread_messages(parent_message.message_id)
+    assert [msg.message_id for msg in thread_messages] == [replacement.message_id]
+    assert threaded_message in sample_conversation.get_thread_messages(None)
+
 
 def test_conversation_metadata_validation():
     """Test conversation metadata validation."""
@@ -432,17 +631,35 @@ def test_conversation_size_estimation(sample_conversation):
     )
     new_size = sample_conversation.get_size_estimate()
     assert new_size > original_size
+    # Only the updated_at timestamp may have changed length
+    assert abs(new_size - len(sample_conversation.model_dump_json())) <= 8
+
+    # Messages removed outside add_message are picked up after invalidation
+    sample_conversation.messages.pop()
+    sample_conversation.invalidate_caches()
+    assert sample_conversation.get_size_estimate() == len(
+        sample_conversation.model_dump_json()
+    )
+
+    # Metadata changes are picked up, including by later add_message calls
+    sample_conversation.metadata.title = "x" * 500
+    sample_conversation.invalidate_caches()
+    titled_size = sample_conversation.get_size_estimate()
+    assert titled_size == len(sample_conversation.model_dump_json())
+    assert titled_size > original_size
+    sample_conversation.add_message("user", "One more message")
+    assert sample_conversation.get_size_estimate() > titled_size
 
 
 def test_atomic_file_operations(temp_persistence_service, sample_conversation):
     """Test that file operations are atomic."""
 
-    # Mock shutil.move to fail
-    def failing_move(*args, **kwargs):
+    # Mock os.replace to fail
+    def failing_replace(*args, **kwargs):
         raise OSError("Simulated failure")
 
     # Save should fail gracefully
-    with patch("shutil.move", side_effect=failing_move):
+    with patch("os.replace", side_effect=failing_replace):
         success = temp_persistence_service.save_conversation_with_validation(
             sample_conversation
         )
@@ -1,46 +1,144 @@
 """End-to-end tests for the chat interface functionality."""
 
-import json
+import hashlib
+import uuid
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
 
+import orjson
 import pytest
 from fastapi.testclient import TestClient
 
 from src.makemyrecipe.api.main import app
+from src.makemyrecipe.services.llm_service import llm_service
+
+pytestmark = pytest.mark.e2e
+
+STUB_LLM_RESPONSE = "Here is a simple pasta recipe."
+
+# BLAKE2b digests of the served frontend assets. Regenerate this file when the
+# frontend changes on purpose.
+SNAPSHOT_PATH = Path(__file__).parent / "snapshots" / "frontend_hashes.json"
+FRONTEND_SNAPSHOTS = orjson.loads(SNAPSHOT_PATH.read_bytes())
+
+REQUIRED_JS = (
+    b"WebSocket",
+    b"onopen",
+    b"onmessage",
+    b"sendMessage",
+    b"displayMessage",
+    b"showTypingIndicator",
+    b"loadConversations",
+    b"startNewConversation",
+    b"showError",
+    b"handleConnectionError",
+)
+REQUIRED_RESPONSIVE_HTML = (
+    b'name="viewport"',
+    b"width=device-width",
+    b"mobile-sidebar-toggle",
+)
+REQUIRED_RESPONSIVE_CSS = (
+    b"@media (max-width: 768px)",
+    b"@media (max-width: 480px)",
+)
+REQUIRED_MODAL_HTML = (
+    b"errorModal",
+    b"errorMessage",
+    b"modal-overlay",
+    b"loadingOverlay",
+    b"loading-spinner",
+)
+REQUIRED_SEARCH_HTML = (
+    b"conversationSearch",
+    b"search-input",
+    b"search-icon",
+    b"conversationList",
+    b"conversation-list",
+)
+
+
+def _recv(ws):
+    """Receive and decode one JSON frame from the chat WebSocket."""
+    return orjson.loads(ws.receive_text())
+
+
+def _rpc(ws, message):
+    """Send one JSON message and decode the frame that answers it."""
+    # The chat endpoint reads text frames, so the orjson bytes are sent as str.
+    ws.send_text(orjson.dumps(message).decode())
+    return _recv(ws)
 
 
 class TestE2EChatInterface:
     """End-to-end tests for the complete chat interface workflow."""
 
-    def setup_method(self):
-        """Set up test client."""
-        self.client = TestClient(app)
-        self.test_user_id = "e2e_test_user"
+    # Shared state lives in class-scoped fixtures, never on instances
+    __slots__ = ()
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def client(cls):
+        """Create one test client shared by every test in the class."""
+        with TestClient(app) as test_client:
+            yield test_client
+
+    @pytest.fixture(autouse=True, scope="class")
+    @classmethod
+    def stub_llm(cls):
+        """Answer every chat turn with a canned reply instead of calling the LLM."""
+        with patch.multiple(
+            llm_service,
+            generate_response=AsyncMock(return_value=STUB_LLM_RESPONSE),
+            generate_response_with_citations=AsyncMock(
+                return_value=(STUB_LLM_RESPONSE, [])
+            ),
+        ):
+            yield
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def test_user_id(cls, worker_id):
+        """Build a user id unique to this run and xdist worker."""
+        return f"e2e_{worker_id}_{uuid.uuid4().hex[:8]}"
+
+    @pytest.fixture
+    def created_conversation(self, client, test_user_id):
+        """Create a conversation via the REST API and delete it afterwards."""
+        user_id = f"{test_user_id}_rest"
+        response = client.post(f"/api/conversations?user_id={user_id}")
+        assert response.status_code == 200
+
+        conversation_id = response.json()["conversation_id"]
+        yield conversation_id, user_id
+
+        # Tests may already have deleted it, so a 404 here is fine
+        client.delete(f"/api/conversations/{conversation_id}")
 
-    def test_complete_chat_workflow(self):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def ws(cls, client, test_user_id):
+        """Open one WebSocket for the error checks and skip its welcome frame."""
+        with client.websocket_connect(f"/ws/chat/{test_user_id}_error") as w:
+            w.receive_text()
+            yield w
+
+    def test_complete_chat_workflow(self, client, html_bytes, test_user_id):
         """Test complete chat workflow from connection to response."""
         # Step 1: Verify main page loads
-        response = self.client.get("/")
-        assert response.status_code == 200
-        assert "MakeMyRecipe" in response.text
+        assert b"MakeMyRecipe" in html_bytes
 
         # Step 2: Test WebSocket connection and chat
-        with self.client.websocket_connect(
-            f"/ws/chat/{self.test_user_id}"
-        ) as websocket:
+        with client.websocket_connect(f"/ws/chat/{test_user_id}") as websocket:
             # Receive welcome message
-            welcome_data = websocket.receive_text()
-            welcome_message = json.loads(welcome_data)
+            welcome_message = _recv(websocket)
 
             assert welcome_message["type"] == "status"
             assert "Connected to MakeMyRecipe" in welcome_message["data"]["message"]
 
-            # Send a recipe request
+            # Send a recipe request and receive the user message confirmation
             chat_message = {"type": "chat", "message": "I need a simple pasta recipe"}
-            websocket.send_text(json.dumps(chat_message))
-
-            # Receive user message confirmation
-            user_msg_data = websocket.receive_text()
-            user_message = json.loads(user_msg_data)
+            user_message = _rpc(websocket, chat_message)
 
             assert user_message["type"] == "user_message"
             assert user_message["data"]["message"] == "I need a simple pasta recipe"
@@ -48,56 +146,30 @@ class TestE2EChatInterface:
 
             conversation_id = user_message["data"]["conversation_id"]
 
-            # Note: We might receive an assistant response or error depending on
-            # LLM availability
-            # For E2E testing, we'll handle both cases
-            try:
-                assistant_msg_data = websocket.receive_text()
-                assistant_message = json.loads(assistant_msg_data)
-
-                if assistant_message["type"] == "assistant_message":
-                    assert "message" in assistant_message["data"]
-                    assert (
-                        assistant_message["data"]["conversation_id"] == conversation_id
-                    )
-                elif assistant_message["type"] == "error":
-                    # LLM service might not be available in test environment
-                    assert "error" in assistant_message["data"]
-            except Exception:
-                # Timeout or connection issue - acceptable for testing
-                pass
+            # The stubbed LLM answers immediately
+            assistant_message = _recv(websocket)
+            assert assistant_message["type"] == "assistant_message"
+            assert assistant_message["data"]["message"] == STUB_LLM_RESPONSE
+            assert assistant_message["data"]["conversation_id"] == conversation_id
 
         # Step 3: Verify conversation was created via REST API
-        response = self.client.get(f"/api/conversations?user_id={self.test_user_id}")
+        response = client.get(f"/api/conversations/{conversation_id}")
         assert response.status_code == 200
 
-        data = response.json()
-        assert "conversations" in data
-        assert data["total"] >= 1
-
-        # Find our conversation
-        our_conversation = None
-        for conv in data["conversations"]:
-            if conv["conversation_id"] == conversation_id:
-                our_conversation = conv
-                break
-
-        if our_conversation:
-            assert our_conversation["user_id"] == self.test_user_id
-            assert len(our_conversation["messages"]) >= 1
-
-            # Check that user message was saved
-            user_messages = [
-                msg for msg in our_conversation["messages"] if msg["role"] == "user"
-            ]
-            assert len(user_messages) >= 1
-            assert user_messages[0]["content"] == ("I need a simple pasta recipe")
-
-    def test_multiple_messages_in_conversation(self):
+        our_conversation = response.json()
+        assert our_conversation["user_id"] == test_user_id
+        assert len(our_conversation["messages"]) >= 1
+
+        # Check that user message was saved
+        user_messages = [
+            msg for msg in our_conversation["messages"] if msg["role"] == "user"
+        ]
+        assert len(user_messages) >= 1
+        assert user_messages[0]["content"] == ("I need a simple pasta recipe")
+
+    def test_multiple_messages_in_conversation(self, client, test_user_id):
         """Test sending multiple messages in the same conversation."""
-        with self.client.websocket_connect(
-            f"/ws/chat/{self.test_user_id}_multi"
-        ) as websocket:
+        with client.websocket_connect(f"/ws/chat/{test_user_id}_multi") as websocket:
             # Skip welcome message
             websocket.receive_text()
 
@@ -106,17 +178,12 @@ class TestE2EChatInterface:
                 "type": "chat",
                 "message": "What ingredients do I need for carbonara?",
             }
-            websocket.send_text(json.dumps(first_message))
-
             # Get user message confirmation
-            user_msg1 = json.loads(websocket.receive_text())
+            user_msg1 = _rpc(websocket, first_message)
             conversation_id = user_msg1["data"]["conversation_id"]
 
-            # Try to receive assistant response (might timeout)
-            try:
-                websocket.receive_text()  # Assistant response or error
-            except Exception:
-                pass
+            # Receive the stubbed assistant response
+            assert _recv(websocket)["type"] == "assistant_message"
 
             # Send second message in same conversation
             second_message = {
@@ -124,23 +191,14 @@ class TestE2EChatInterface:
                 "message": "How long does it take to cook?",
                 "conversation_id": conversation_id,
             }
-            websocket.send_text(json.dumps(second_message))
-
             # Get user message confirmation
-            user_msg2 = json.loads(websocket.receive_text())
+            user_msg2 = _rpc(websocket, second_message)
             assert user_msg2["data"]["conversation_id"] == conversation_id
             assert user_msg2["data"]["message"] == "How long does it take to cook?"
 
-    def test_conversation_persistence(self):
+    def test_conversation_persistence(self, client, created_conversation):
         """Test that conversations persist and can be retrieved."""
-        test_user = f"{self.test_user_id}_persist"
-
-        # Create a conversation via REST API
-        response = self.client.post(f"/api/conversations?user_id={test_user}")
-        assert response.status_code == 200
-
-        conversation_data = response.json()
-        conversation_id = conversation_data["conversation_id"]
+        conversation_id, test_user = created_conversation
 
         # Send a message via REST API
         chat_request = {
@@ -149,12 +207,11 @@ class TestE2EChatInterface:
             "conversation_id": conversation_id,
         }
 
-        response = self.client.post("/api/chat", json=chat_request)
-        # Should return 200 or 500 (if LLM unavailable)
-        assert response.status_code in [200, 500]
+        response = client.post("/api/chat", json=chat_request)
+        assert response.status_code == 200
 
         # Retrieve the conversation
-        response = self.client.get(f"/api/conversations/{conversation_id}")
+        response = client.get(f"/api/conversations/{conversation_id}")
         assert response.status_code == 200
 
         retrieved_conversation = response.json()
@@ -168,89 +225,64 @@ class TestE2EChatInterface:
         assert len(user_messages) >= 1
         assert any("Italian cuisine" in msg["content"] for msg in user_messages)
 
-    def test_conversation_deletion(self):
+    def test_conversation_deletion(self, client, created_conversation):
         """Test conversation deletion functionality."""
-        test_user = f"{self.test_user_id}_delete"
-
-        # Create a conversation
-        response = self.client.post(f"/api/conversations?user_id={test_user}")
-        assert response.status_code == 200
-
-        conversation_id = response.json()["conversation_id"]
+        conversation_id, _ = created_conversation
 
         # Verify it exists
-        response = self.client.get(f"/api/conversations/{conversation_id}")
+        response = client.get(f"/api/conversations/{conversation_id}")
         assert response.status_code == 200
 
         # Delete it
-        response = self.client.delete(f"/api/conversations/{conversation_id}")
+        response = client.delete(f"/api/conversations/{conversation_id}")
         assert response.status_code == 200
 
         # Verify it's gone
-        response = self.client.get(f"/api/conversations/{conversation_id}")
+        response = client.get(f"/api/conversations/{conversation_id}")
         assert response.status_code == 404
 
-    def test_websocket_error_handling(self):
-        """Test WebSocket error handling scenarios."""
-        with self.client.websocket_connect(
-            f"/ws/chat/{self.test_user_id}_error"
-        ) as websocket:
-            # Skip welcome message
-            websocket.receive_text()
-
-            # Test invalid message type
-            invalid_message = {
-                "type": "invalid_type",
-                "message": "This should cause an error",
-            }
-            websocket.send_text(json.dumps(invalid_message))
-
-            error_response = json.loads(websocket.receive_text())
-            assert error_response["type"] == "error"
-            assert "Unknown message type" in error_response["data"]["error"]
-
-            # Test empty message
-            empty_message = {"type": "chat", "message": ""}
-            websocket.send_text(json.dumps(empty_message))
-
-            error_response = json.loads(websocket.receive_text())
-            assert error_response["type"] == "error"
-            assert "Message cannot be empty" in error_response["data"]["error"]
-
-    def test_websocket_nonexistent_conversation(self):
-        """Test WebSocket with non-existent conversation ID."""
-        with self.client.websocket_connect(
-            f"/ws/chat/{self.test_user_id}_nonexistent"
-        ) as websocket:
-            # Skip welcome message
-            websocket.receive_text()
-
-            # Send message with non-existent conversation ID
-            message_with_fake_id = {
-                "type": "chat",
-                "message": "Hello",
-                "conversation_id": "fake_conversation_id_12345",
-            }
-            websocket.send_text(json.dumps(message_with_fake_id))
-
-            error_response = json.loads(websocket.receive_text())
-            assert error_response["type"] == "error"
-            assert "Conversation not found" in error_response["data"]["error"]
-
-    def test_static_assets_caching(self):
+    @pytest.mark.parametrize(
+        "payload,expected_error",
+        [
+            (
+                {"type": "invalid_type", "message": "This should cause an error"},
+                "Unknown message type",
+            ),
+            ({"type": "chat", "message": ""}, "Message cannot be empty"),
+            (
+                {
+                    "type": "chat",
+                    "message": "Hello",
+                    "conversation_id": "fake_conversation_id_12345",
+                },
+                "Conversation not found",
+            ),
+        ],
+    )
+    def test_websocket_error_handling(self, ws, payload, expected_error):
+        """Test WebSocket error responses for invalid messages."""
+        error_response = _rpc(ws, payload)
+        assert error_response["type"] == "error"
+        assert expected_error in error_response["data"]["error"]
+
+    def test_static_assets_caching(self, client):
         """Test that static assets have appropriate caching headers."""
+        # Header-only checks, so HEAD skips reading the file bodies
         # Test CSS file
-        response = self.client.get("/static/css/styles.css")
+        response = client.head("/static/css/styles.css")
         assert response.status_code == 200
         # FastAPI's StaticFiles should set appropriate headers
+        assert "etag" in response.headers
+        assert "last-modified" in response.headers
 
         # Test JS file
-        response = self.client.get("/static/js/app.js")
+        response = client.head("/static/js/app.js")
         assert response.status_code == 200
+        assert "etag" in response.headers
 
-    def test_api_rate_limiting_headers(self):
+    def test_api_rate_limiting_headers(self, client):
         """Test API responses include appropriate headers."""
-        response = self.client.get("/health")
+        response = client.get("/health")
         assert response.status_code == 200
 
         # Check for security headers (from middleware)
@@ -258,111 +290,72 @@ class TestE2EChatInterface:
         assert "x-content-type-options" in headers
         assert "x-frame-options" in headers
 
-    def test_frontend_javascript_functionality(self):
-        """Test that frontend JavaScript contains expected functionality."""
-        response = self.client.get("/static/js/app.js")
-        js_content = response.text
-
-        # Check for WebSocket handling
-        assert "WebSocket" in js_content
-        assert "onopen" in js_content
-        assert "onmessage" in js_content
-
-        # Check for UI interaction methods
-        assert "sendMessage" in js_content
-        assert "displayMessage" in js_content
-        assert "showTypingIndicator" in js_content
+    @pytest.mark.parametrize("path,expected", sorted(FRONTEND_SNAPSHOTS.items()))
+    def test_asset_snapshot(self, client, path, expected):
+        """Test that served frontend assets match their recorded snapshots."""
+        response = client.get(path)
+        assert response.status_code == 200
 
-        # Check for conversation management
-        assert "loadConversations" in js_content
-        assert "startNewConversation" in js_content
+        digest = hashlib.blake2b(response.content, digest_size=16).hexdigest()
+        assert digest == expected, f"{path} changed; update {SNAPSHOT_PATH.name}"
 
-        # Check for error handling
-        assert "showError" in js_content
-        assert "handleConnectionError" in js_content
+    @pytest.mark.smoke
+    @pytest.mark.parametrize("needle", REQUIRED_JS)
+    def test_frontend_javascript_functionality(self, js_bytes, needle):
+        """Test that frontend JavaScript contains expected functionality."""
+        # WebSocket handling, UI interaction, conversation management and
+        # error handling hooks
+        assert needle in js_bytes, f"{needle.decode()} not found in JavaScript"
 
-    def test_responsive_design_elements(self):
+    @pytest.mark.smoke
+    @pytest.mark.parametrize("needle", REQUIRED_RESPONSIVE_HTML)
+    def test_responsive_design_elements(self, html_bytes, needle):
         """Test that responsive design elements are present."""
-        response = self.client.get("/")
-        html_content = response.text
-
-        # Check for responsive meta tag
-        assert 'name="viewport"' in html_content
-        assert "width=device-width" in html_content
-
-        # Check for mobile-specific elements
-        assert "mobile-sidebar-toggle" in html_content
+        # Check for responsive meta tag and mobile-specific elements
+        assert needle in html_bytes, f"{needle.decode()} not found in HTML"
 
-        # Check CSS for responsive breakpoints
-        css_response = self.client.get("/static/css/styles.css")
-        css_content = css_response.text
+    @pytest.mark.smoke
+    @pytest.mark.parametrize("needle", REQUIRED_RESPONSIVE_CSS)
+    def test_responsive_breakpoints(self, css_bytes, needle):
+        """Test that the stylesheet has responsive breakpoints."""
+        assert needle in css_bytes, f"{needle.decode()} not found in CSS"
 
-        assert "@media (max-width: 768px)" in css_content
-        assert "@media (max-width: 480px)" in css_content
-
-    def test_accessibility_features(self):
+    @pytest.mark.smoke
+    def test_accessibility_features(self, html_bytes):
         """Test accessibility features in the interface."""
-        response = self.client.get("/")
-        html_content = response.text
-
         # Check for semantic HTML
-        assert "<main" in html_content
-        assert "<aside" in html_content
+        assert b"<main" in html_bytes
+        assert b"<aside" in html_bytes
 
         # Check for proper form labels and inputs
-        assert "placeholder=" in html_content
-        assert "aria-" in html_content or "role=" in html_content
+        assert b"placeholder=" in html_bytes
+        assert b"aria-" in html_bytes or b"role=" in html_bytes
 
         # Check for keyboard navigation support
-        assert "tabindex=" in html_content or "button" in html_content
+        assert b"tabindex=" in html_bytes or b"button" in html_bytes
 
-    def test_performance_optimizations(self):
+    @pytest.mark.smoke
+    def test_performance_optimizations(self, html_bytes, scripts_non_blocking):
         """Test performance optimization features."""
-        response = self.client.get("/")
-        html_content = response.text
-
         # Check for font preloading
-        assert 'rel="preconnect"' in html_content
+        assert b'rel="preconnect"' in html_bytes
 
         # Check for optimized font loading
-        assert "display=swap" in html_content
+        assert b"display=swap" in html_bytes
 
-        # Check for efficient resource loading
-        script_position = html_content.find("<script")
-        body_end_position = html_content.find("</body>")
+        # Scripts should be deferred/async or loaded at the end of <body>
+        assert scripts_non_blocking, "Scripts should be optimized for loading"
 
-        # Scripts should be loaded at the end or be deferred/async
-        scripts_at_end = script_position > body_end_position - 500
-        has_defer_async = "defer" in html_content or "async" in html_content
-
-        assert (
-            scripts_at_end or has_defer_async
-        ), "Scripts should be optimized for loading"
-
-    def test_error_modal_functionality(self):
+    @pytest.mark.smoke
+    @pytest.mark.parametrize("needle", REQUIRED_MODAL_HTML)
+    def test_error_modal_functionality(self, html_bytes, needle):
         """Test error modal elements are present."""
-        response = self.client.get("/")
-        html_content = response.text
-
-        # Check for error modal elements
-        assert "errorModal" in html_content
-        assert "errorMessage" in html_content
-        assert "modal-overlay" in html_content
+        # Check for error modal and loading overlay elements
+        assert needle in html_bytes, f"{needle.decode()} not found in HTML"
 
-        # Check for loading overlay
-        assert "loadingOverlay" in html_content
-        assert "loading-spinner" in html_content
-
-    def test_conversation_search_functionality(self):
+    @pytest.mark.smoke
+    @pytest.mark.parametrize("needle", REQUIRED_SEARCH_HTML)
+    def test_conversation_search_functionality(self, html_bytes, needle):
         """Test conversation search elements are present."""
-        response = self.client.get("/")
-        html_content = response.text
-
-        # Check for search elements
-        assert "conversationSearch" in html_content
-        assert "search-input" in html_content
-        assert "search-icon" in html_content
-
-        # Check for conversation list
-        assert "conversationList" in html_content
-        assert "conversation-list" in html_content
+        # Check for search elements and the conversation list
+        assert needle in html_bytes, f"{needle.decode()} not found in HTML"
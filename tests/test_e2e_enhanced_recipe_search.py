@@ -1,192 +1,204 @@
 """End-to-end integration tests for enhanced recipe search functionality."""
 
-from unittest.mock import AsyncMock, MagicMock, patch
+from typing import List, NamedTuple
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
-from src.makemyrecipe.models.recipe import Citation, Recipe
+from src.makemyrecipe.core.config import settings
+from src.makemyrecipe.models.recipe import (
+    Citation,
+    Recipe,
+    convert_recipe_result_to_recipe,
+)
 from src.makemyrecipe.services.anthropic_service import AnthropicService
-from src.makemyrecipe.services.recipe_service import RecipeService
+from src.makemyrecipe.services.recipe_service import (
+    CuisineType,
+    DifficultyLevel,
+    RecipeMetadata,
+    RecipeResult,
+    RecipeService,
+)
 
+pytestmark = pytest.mark.e2e
 
-class TestE2EEnhancedRecipeSearch:
-    """End-to-end tests for the complete enhanced recipe search workflow."""
 
-    @pytest.mark.asyncio
-    async def test_complete_search_workflow_with_search_tags(self):
-        """Test the complete workflow from user query to Recipe objects with citations."""
+class _Block(NamedTuple):
+    """Text content block of a canned LLM response."""
 
-        # Mock the Anthropic client responses
-        # First response: LLM generates search tags
-        mock_initial_response = MagicMock()
-        mock_initial_text = MagicMock()
-        mock_initial_text.text = """
-        I'll help you find a great carbonara recipe! Let me search for authentic recipes.
+    text: str
 
-        <search>authentic Italian carbonara recipe traditional</search>
 
-        I'll look for the best carbonara recipes from trusted cooking sources.
-        """
-        mock_initial_response.content = [mock_initial_text]
+class _Resp(NamedTuple):
+    """Canned LLM response; the service only reads ``content[i].text``."""
 
-        # Search response: Mock search results
-        mock_search_response = MagicMock()
-        mock_search_text = MagicMock()
-        mock_search_text.text = (
-            "Found great carbonara recipes from Allrecipes and Food Network"
-        )
-        mock_search_response.content = [mock_search_text]
-
-        # Final response: LLM provides structured recipe based on search results
-        mock_final_response = MagicMock()
-        mock_final_text = MagicMock()
-        mock_final_text.text = """
-        **Authentic Spaghetti Carbonara**
-
-        This classic Roman pasta dish is creamy, rich, and absolutely delicious. Made with just a few simple ingredients, it's a perfect example of Italian cuisine at its finest.
-
-        **Ingredients:**
-        - 400g spaghetti
-        - 200g guanciale or pancetta, diced
-        - 4 large eggs
-        - 100g Pecorino Romano cheese, grated
-        - Freshly ground black pepper
-        - Salt for pasta water
-
-        **Instructions:**
-        1. Bring a large pot of salted water to boil and cook spaghetti until al dente
-        2. While pasta cooks, heat a large skillet and cook guanciale until crispy
-        3. In a bowl, whisk together eggs, grated cheese, and black pepper
-        4. Drain pasta, reserving 1 cup of pasta water
-        5. Add hot pasta to the skillet with guanciale
-        6. Remove from heat and quickly stir in egg mixture, adding pasta water as needed
-        7. Serve immediately with extra cheese and black pepper
-
-        **Prep time:** 15 minutes
-        **Cook time:** 20 minutes
-        **Total time:** 35 minutes
-        **Servings:** 4
-        **Difficulty:** intermediate
-        **Cuisine:** italian
-        """
-        mock_final_response.content = [mock_final_text]
-
-        # Mock citations from search
-        mock_citations = [
-            {
-                "title": "Authentic Carbonara Recipe - Allrecipes",
-                "url": "https://allrecipes.com/recipe/carbonara",
-                "snippet": "This traditional carbonara recipe is creamy and delicious...",
-            },
-            {
-                "title": "Perfect Carbonara - Food Network",
-                "url": "https://foodnetwork.com/recipes/carbonara",
-                "snippet": "Learn to make perfect carbonara with this step-by-step guide...",
-            },
-        ]
+    content: List[_Block]
 
-        # Setup the mock client to return our responses in sequence
-        mock_client = AsyncMock()
-        mock_client.messages.create.side_effect = [
-            mock_initial_response,  # Initial response with search tags
-            mock_search_response,  # Search results
-            mock_final_response,  # Final structured response
-        ]
 
-        # Create services and inject mock client
-        anthropic_service = AnthropicService()
-        anthropic_service.client = mock_client
+# Canned LLM responses for the search tag workflow.
+# First response: LLM generates search tags
+_INITIAL_SEARCH_TEXT = """
+    I'll help you find a great carbonara recipe! Let me search for authentic recipes.
+
+    <search>authentic Italian carbonara recipe traditional</search>
+
+    I'll look for the best carbonara recipes from trusted cooking sources.
+    """
+_INITIAL_RESP = _Resp(content=[_Block(text=_INITIAL_SEARCH_TEXT)])
+
+# Search response: Mock search results
+_SEARCH_RESULT_TEXT = "Found great carbonara recipes from Allrecipes and Food Network"
+_SEARCH_RESP = _Resp(content=[_Block(text=_SEARCH_RESULT_TEXT)])
+
+# Final response: LLM provides structured recipe based on search results
+_FINAL_RECIPE_TEXT = """
+    **Authentic Spaghetti Carbonara**
+
+    This classic Roman pasta dish is creamy, rich, and absolutely delicious. Made with just a few simple ingredients, it's a perfect example of Italian cuisine at its finest.
+
+    **Ingredients:**
+    - 400g spaghetti
+    - 200g guanciale or pancetta, diced
+    - 4 large eggs
+    - 100g Pecorino Romano cheese, grated
+    - Freshly ground black pepper
+    - Salt for pasta water
+
+    **Instructions:**
+    1. Bring a large pot of salted water to boil and cook spaghetti until al dente
+    2. While pasta cooks, heat a large skillet and cook guanciale until crispy
+    3. In a bowl, whisk together eggs, grated cheese, and black pepper
+    4. Drain pasta, reserving 1 cup of pasta water
+    5. Add hot pasta to the skillet with guanciale
+    6. Remove from heat and quickly stir in egg mixture, adding pasta water as needed
+    7. Serve immediately with extra cheese and black pepper
+
+    **Prep time:** 15 minutes
+    **Cook time:** 20 minutes
+    **Total time:** 35 minutes
+    **Servings:** 4
+    **Difficulty:** intermediate
+    **Cuisine:** italian
+    """
+_FINAL_RESP = _Resp(content=[_Block(text=_FINAL_RECIPE_TEXT)])
+
+# Text with multiple search tags for extraction tests
+_TEXT_WITH_TAGS = """
+    I'll help you with that recipe!
+
+    <search>pasta carbonara authentic recipe</search>
+
+    Let me also search for some variations:
+
+    <search>carbonara recipe variations vegetarian</search>
+
+    Here's what I found...
+    """
 
+
+class TestE2EEnhancedRecipeSearch:
+    """End-to-end tests for the complete enhanced recipe search workflow."""
+
+    # Shared state lives in class-scoped fixtures, never on instances
+    __slots__ = ()
+
+    @pytest.fixture(autouse=True, scope="class")
+    @classmethod
+    def mock_settings(cls):
+        """Pin the model settings once for every test in the class."""
+        with patch.multiple(
+            settings,
+            anthropic_model="claude-sonnet-4-20250514",
+            anthropic_max_tokens=2000,
+            anthropic_temperature=0.7,
+        ):
+            yield settings
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def anthropic_service(cls, mock_settings):
+        """Create one Anthropic service shared by every test in the class."""
+        return AnthropicService()
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def recipe_service(cls, anthropic_service):
+        """Create one recipe service wired to the shared Anthropic service."""
         recipe_service = RecipeService()
         recipe_service.anthropic_service = anthropic_service
+        return recipe_service
 
-        # Mock settings
-        with patch(
-            "src.makemyrecipe.services.anthropic_service.settings"
-        ) as mock_settings:
-            mock_settings.anthropic_model = "claude-sonnet-4-20250514"
-            mock_settings.anthropic_max_tokens = 2000
-            mock_settings.anthropic_temperature = 0.7
-
-            # Execute the enhanced recipe search
-            recipes, raw_response = await recipe_service.search_recipes_enhanced(
-                "I want to make authentic carbonara"
-            )
-
-            # Verify the results
-            assert len(recipes) >= 1, "Should return at least one recipe"
-
-            recipe = recipes[0]
-            assert isinstance(recipe, Recipe), "Should return Recipe objects"
-
-            # Check recipe content
-            assert (
-                "carbonara" in recipe.title.lower()
-            ), "Recipe title should contain 'carbonara'"
-            assert len(recipe.ingredients) > 0, "Recipe should have ingredients"
-            assert len(recipe.instructions) > 0, "Recipe should have instructions"
-
-            # Check metadata
-            assert recipe.prep_time is not None, "Should have prep time"
-            assert recipe.cook_time is not None, "Should have cook time"
-            assert recipe.servings is not None, "Should have servings"
-
-            # Check that search query is preserved
-            assert recipe.search_query == "I want to make authentic carbonara"
-
-            # Check that primary source citation exists
-            assert (
-                recipe.primary_source is not None
-            ), "Should have primary source citation"
-            assert isinstance(
-                recipe.primary_source, Citation
-            ), "Primary source should be Citation object"
-
-            # Check that the recipe has proper timestamps and ID
-            assert recipe.id is not None, "Recipe should have an ID"
-            assert (
-                recipe.created_at is not None
-            ), "Recipe should have creation timestamp"
-            assert recipe.updated_at is not None, "Recipe should have update timestamp"
-
-            # Verify that multiple API calls were made (search tag workflow)
-            assert (
-                mock_client.messages.create.call_count == 3
-            ), "Should make 3 API calls for search tag workflow"
-
-            # Verify the raw response contains useful information
-            assert isinstance(raw_response, str), "Should return raw response string"
-            assert len(raw_response) > 0, "Raw response should not be empty"
-
-    @pytest.mark.asyncio
-    async def test_search_tag_extraction_and_processing(self):
-        """Test that search tags are properly extracted and processed."""
+    async def test_complete_search_workflow_with_search_tags(
+        self, anthropic_service, recipe_service, monkeypatch
+    ):
+        """Test the complete workflow from user query to Recipe objects with citations."""
+
+        # Setup the mock client to return our responses in sequence
+        mock_client = AsyncMock()
+        mock_client.messages.create.side_effect = iter(
+            (_INITIAL_RESP, _SEARCH_RESP, _FINAL_RESP)
+        )
 
-        anthropic_service = AnthropicService()
+        # Inject the mock client for this test only
+        monkeypatch.setattr(anthropic_service, "client", mock_client)
 
-        # Test search tag extraction
-        text_with_tags = """
-        I'll help you with that recipe!
+        # Execute the enhanced recipe search
+        recipes, raw_response = await recipe_service.search_recipes_enhanced(
+            "I want to make authentic carbonara"
+        )
 
-        <search>pasta carbonara authentic recipe</search>
+        # Verify the results
+        assert len(recipes) >= 1, "Should return at least one recipe"
 
-        Let me also search for some variations:
+        recipe = recipes[0]
+        assert isinstance(recipe, Recipe), "Should return Recipe objects"
 
-        <search>carbonara recipe variations vegetarian</search>
+        # Check recipe content
+        assert (
+            "carbonara" in recipe.title.lower()
+        ), "Recipe title should contain 'carbonara'"
+        assert len(recipe.ingredients) > 0, "Recipe should have ingredients"
+        assert len(recipe.instructions) > 0, "Recipe should have instructions"
+
+        # Check metadata
+        assert recipe.prep_time is not None, "Should have prep time"
+        assert recipe.cook_time is not None, "Should have cook time"
+        assert recipe.servings is not None, "Should have servings"
+
+        # Check that search query is preserved
+        assert recipe.search_query == "I want to make authentic carbonara"
+
+        # Check that primary source citation exists
+        assert recipe.primary_source is not None, "Should have primary source citation"
+        assert isinstance(
+            recipe.primary_source, Citation
+        ), "Primary source should be Citation object"
+
+        # Check that the recipe has proper timestamps and ID
+        assert recipe.id is not None, "Recipe should have an ID"
+        assert recipe.created_at is not None, "Recipe should have creation timestamp"
+        assert recipe.updated_at is not None, "Recipe should have update timestamp"
+
+        # Verify that multiple API calls were made (search tag workflow)
+        assert (
+            mock_client.messages.create.call_count == 3
+        ), "Should make 3 API calls for search tag workflow"
 
-        Here's what I found...
-        """
+        # Verify the raw response contains useful information
+        assert isinstance(raw_response, str), "Should return raw response string"
+        assert len(raw_response) > 0, "Raw response should not be empty"
 
-        # Extract search queries
-        queries = anthropic_service._extract_search_queries(text_with_tags)
+    async def test_search_tag_extraction_and_processing(self, anthropic_service):
+        """Test that search tags are properly extracted and processed."""
+
+        # Extract search queries and strip their tags in one pass
+        queries, cleaned_text = anthropic_service._split_search_tags(_TEXT_WITH_TAGS)
 
         assert len(queries) == 2, "Should extract 2 search queries"
         assert "pasta carbonara authentic recipe" in queries
         assert "carbonara recipe variations vegetarian" in queries
 
         # Test search tag removal
-        cleaned_text = anthropic_service._remove_search_tags(text_with_tags)
-
         assert "<search>" not in cleaned_text, "Should remove search tags"
         assert "</search>" not in cleaned_text, "Should remove search tags"
         assert (
@@ -197,18 +209,9 @@ class TestE2EEnhancedRecipeSearch:
         ), "Should preserve other content"
         assert "Here's what I found..." in cleaned_text, "Should preserve other content"
 
-    @pytest.mark.asyncio
     async def test_recipe_conversion_with_citations(self):
         """Test conversion from RecipeResult to Recipe with proper citations."""
 
-        from src.makemyrecipe.models.recipe import convert_recipe_result_to_recipe
-        from src.makemyrecipe.services.recipe_service import (
-            CuisineType,
-            DifficultyLevel,
-            RecipeMetadata,
-            RecipeResult,
-        )
-
         # Create a sample RecipeResult
         metadata = RecipeMetadata(
             prep_time=15,
@@ -276,10 +279,9 @@ class TestE2EEnhancedRecipeSearch:
         assert recipe.primary_source in all_citations
         assert additional_citation in all_citations
 
-    def test_system_prompt_includes_search_instructions(self):
+    def test_system_prompt_includes_search_instructions(self, anthropic_service):
         """Test that the system prompt includes proper search tag instructions."""
 
-        anthropic_service = AnthropicService()
         prompt = anthropic_service._create_recipe_system_prompt()
 
         # Check for key search instruction elements
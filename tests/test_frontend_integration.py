@@ -1,192 +1,329 @@
 """Integration tests for the frontend chat interface."""
 
 import asyncio
-import json
+import re
+from typing import AsyncIterator
+from unittest.mock import AsyncMock
 
+import orjson
 import pytest
 from fastapi.testclient import TestClient
 from fastapi.websockets import WebSocketDisconnect
+from httpx import ASGITransport, AsyncClient
+from httpx_ws import aconnect_ws
+from httpx_ws.transport import ASGIWebSocketTransport
 
 from src.makemyrecipe.api.main import app
 
+# Fewest ARIA attributes plus roles the index page may carry
+_MIN_A11Y_HINTS = 3
+
+# Opening tag of any HTML5 sectioning element
+_SEMANTIC_ELEMENT_RE = re.compile(rb"<(?:main|aside|header|nav|section|article)\b")
+
+# Client frames sent over the chat WebSocket, serialized once; the endpoint
+# reads text frames, so the orjson bytes are decoded to str
+_PASTA_CHAT_MESSAGE = "Hello, I need a recipe for pasta"
+_PASTA_CHAT_FRAME = orjson.dumps(
+    {"type": "chat", "message": _PASTA_CHAT_MESSAGE}
+).decode()
+_EMPTY_CHAT_FRAME = orjson.dumps({"type": "chat", "message": ""}).decode()
+_PING_FRAME = orjson.dumps({"type": "ping"}).decode()
+_INVALID_JSON_FRAME = "invalid json"
+
+# Canned assistant reply returned by the stubbed LLM
+_STUB_LLM_REPLY = "Try a simple aglio e olio."
+
+
+@pytest.fixture
+def stub_llm(monkeypatch: pytest.MonkeyPatch) -> AsyncMock:
+    """Answer chat requests with a canned reply instead of calling the LLM."""
+    mock_generate = AsyncMock(return_value=(_STUB_LLM_REPLY, []))
+    monkeypatch.setattr(
+        "src.makemyrecipe.api.routes.chat.llm_service.generate_response_with_citations",
+        mock_generate,
+    )
+    return mock_generate
+
+
+# Snippets the stylesheet must define: custom properties, responsive
+# breakpoints and classes, accessibility media queries and keyframe animations
+_EXPECTED_CSS_TOKENS = frozenset(
+    {
+        b"--primary-color:",
+        b"--bg-primary:",
+        b"--text-primary:",
+        b"--border-light:",
+        b"--spacing-md:",
+        b"--radius-md:",
+        b"--transition-fast:",
+        b"@media (max-width: 768px)",
+        b"@media (max-width: 480px)",
+        b".mobile-sidebar-toggle",
+        b".sidebar.open",
+        b"@media (prefers-reduced-motion: reduce)",
+        b"@media (prefers-contrast: high)",
+        b"@media (prefers-color-scheme: dark)",
+        b"@keyframes fadeInUp",
+        b"@keyframes typing",
+        b"@keyframes modalSlideIn",
+    }
+)
+
+# Snippets the application script must contain: WebSocket event handlers,
+# reconnection logic and DOM manipulation
+_EXPECTED_JS_TOKENS = frozenset(
+    {
+        b"onopen",
+        b"onmessage",
+        b"onclose",
+        b"onerror",
+        b"attemptReconnect(",
+        b"reconnectAttempts",
+        b"getElementById(",
+        b"createElement(",
+        b"appendChild(",
+        b"addEventListener(",
+    }
+)
+
+# Snippets the index page must contain: form elements and their attributes,
+# meta tags and external resources
+_EXPECTED_HTML_TOKENS = frozenset(
+    {
+        b"<textarea",
+        b"<button",
+        b"<input",
+        b'type="text"',
+        b"placeholder=",
+        b"maxlength=",
+        b'<meta charset="UTF-8">',
+        b'name="viewport"',
+        b"<title>",
+        b'rel="stylesheet"',
+        b'rel="preconnect"',
+    }
+)
+
+# Component classes the stylesheet must style
+_COMPONENT_CLASSES = (
+    b".app-container",
+    b".sidebar",
+    b".chat-container",
+    b".messages-container",
+    b".message",
+    b".message-bubble",
+    b".typing-indicator",
+    b".input-container",
+    b".recipe-card",
+    b".citation",
+    b".modal",
+    b".loading-overlay",
+)
+
+# Any of the component classes as a whole class name, so .message does not
+# match inside .message-bubble
+_COMPONENT_RE = re.compile(
+    rb"\.("
+    + b"|".join(re.escape(component[1:]) for component in _COMPONENT_CLASSES)
+    + rb")(?![\w-])"
+)
+
+# The application class and its essential methods
+_APP_METHODS = (
+    b"class MakeMyRecipeApp",
+    b"constructor()",
+    b"connect()",
+    b"sendMessage()",
+    b"displayMessage(",
+    b"handleWebSocketMessage(",
+    b"loadConversations(",
+    b"showTypingIndicator(",
+    b"hideTypingIndicator(",
+)
+
+# try/catch blocks and the error handling methods of the application script
+_ERROR_HANDLING_SNIPPETS = (
+    b"try {",
+    b"catch (error)",
+    b"showError(",
+    b"handleConnectionError(",
+    b"handleWebSocketError(",
+)
+
 
 class TestFrontendIntegration:
     """Test frontend integration with the API."""
 
-    def setup_method(self):
-        """Set up test client."""
-        self.client = TestClient(app)
-
-    def test_static_files_served(self):
+    @pytest.fixture(scope="class")
+    @classmethod
+    async def http_client(cls) -> AsyncIterator[AsyncClient]:
+        """Create one async client shared by the class's plain HTTP tests."""
+        # ASGITransport skips the lifespan, so run it to cache the OpenAPI schema
+        async with app.router.lifespan_context(app):
+            async with AsyncClient(
+                transport=ASGITransport(app=app), base_url="http://test"
+            ) as test_client:
+                yield test_client
+
+    async def test_static_files_served(self, http_client: AsyncClient):
         """Test that static files are properly served."""
         # Test main HTML file
-        response = self.client.get("/")
+        response = await http_client.get("/")
         assert response.status_code == 200
         assert "MakeMyRecipe" in response.text
         assert "text/html" in response.headers.get("content-type", "")
 
-    def test_static_css_served(self):
+    async def test_static_css_served(self, http_client: AsyncClient):
         """Test that CSS files are served."""
-        response = self.client.get("/static/css/styles.css")
+        response = await http_client.get("/static/css/styles.css")
         assert response.status_code == 200
         assert "text/css" in response.headers.get("content-type", "")
         assert "--primary-color" in response.text  # Check for CSS variables
 
-    def test_static_js_served(self):
+    async def test_static_js_served(self, http_client: AsyncClient):
         """Test that JavaScript files are served."""
-        response = self.client.get("/static/js/app.js")
+        response = await http_client.get("/static/js/app.js")
         assert response.status_code == 200
         assert "javascript" in response.headers.get("content-type", "")
         assert "MakeMyRecipeApp" in response.text  # Check for main class
 
-    def test_api_info_endpoint(self):
+    @pytest.mark.parametrize("path", ["/static/css/styles.css", "/static/js/app.js"])
+    async def test_static_cache_headers(self, http_client: AsyncClient, path: str):
+        """Test that static assets can be cached and revalidated."""
+        response = await http_client.get(path)
+        assert response.status_code == 200
+        assert response.headers["cache-control"].startswith("public, max-age=")
+        assert "etag" in response.headers
+
+        # A matching ETag should revalidate without resending the body
+        revalidated = await http_client.get(
+            path, headers={"If-None-Match": response.headers["etag"]}
+        )
+        assert revalidated.status_code == 304
+        assert revalidated.content == b""
+        assert "cache-control" in revalidated.headers
+
+    async def test_api_info_endpoint(self, http_client: AsyncClient):
         """Test API info endpoint."""
-        response = self.client.get("/api")
+        response = await http_client.get("/api")
         assert response.status_code == 200
         data = response.json()
         assert "message" in data
         assert "version" in data
         assert "docs" in data
 
-    def test_health_endpoint(self):
+    async def test_health_endpoint(self, http_client: AsyncClient):
         """Test health check endpoint."""
-        response = self.client.get("/health")
+        response = await http_client.get("/health")
         assert response.status_code == 200
         data = response.json()
         assert data["status"] == "healthy"
         assert "app_name" in data
         assert "version" in data
 
-    def test_websocket_connection(self):
-        """Test WebSocket connection."""
+    def test_websocket_protocol(
+        self, app_client: TestClient, subtests: pytest.Subtests
+    ):
+        """Test the welcome, ping/pong and error frames over one connection."""
         user_id = "test_user_123"
 
-        with self.client.websocket_connect(f"/ws/chat/{user_id}") as websocket:
-            # Should receive welcome message
-            data = websocket.receive_text()
-            message = json.loads(data)
+        with app_client.websocket_connect(f"/ws/chat/{user_id}") as websocket:
+            with subtests.test("welcome"):
+                # Should receive welcome message
+                message = orjson.loads(websocket.receive_text())
+
+                assert message["type"] == "status"
+                assert message["data"]["user_id"] == user_id
+                assert "Connected to MakeMyRecipe" in message["data"]["message"]
+
+            with subtests.test("ping"):
+                # Send ping, should receive pong
+                websocket.send_text(_PING_FRAME)
+                pong_message = orjson.loads(websocket.receive_text())
+
+                assert pong_message["type"] == "pong"
+                assert pong_message["data"]["message"] == "pong"
+
+            with subtests.test("invalid json"):
+                # Send invalid JSON, should receive error message
+                websocket.send_text(_INVALID_JSON_FRAME)
+                error_message = orjson.loads(websocket.receive_text())
+
+                assert error_message["type"] == "error"
+                assert "Invalid JSON format" in error_message["data"]["error"]
 
-            assert message["type"] == "status"
-            assert message["data"]["user_id"] == user_id
-            assert "Connected to MakeMyRecipe" in message["data"]["message"]
+            with subtests.test("empty message"):
+                # Send empty chat message, should receive error message
+                websocket.send_text(_EMPTY_CHAT_FRAME)
+                error_message = orjson.loads(websocket.receive_text())
 
-    def test_websocket_chat_message(self):
-        """Test sending chat message via WebSocket."""
+                assert error_message["type"] == "error"
+                assert "Message cannot be empty" in error_message["data"]["error"]
+
+    def test_websocket_echoes_user_message(self, app_client: TestClient):
+        """Test that a chat message is echoed back as a user message."""
         user_id = "test_user_456"
 
-        with self.client.websocket_connect(f"/ws/chat/{user_id}") as websocket:
+        with app_client.websocket_connect(f"/ws/chat/{user_id}") as websocket:
             # Skip welcome message
             websocket.receive_text()
 
             # Send chat message
-            chat_message = {
-                "type": "chat",
-                "message": "Hello, I need a recipe for pasta",
-            }
-            websocket.send_text(json.dumps(chat_message))
+            websocket.send_text(_PASTA_CHAT_FRAME)
 
             # Should receive user message confirmation
             user_msg_data = websocket.receive_text()
-            user_message = json.loads(user_msg_data)
+            user_message = orjson.loads(user_msg_data)
 
             assert user_message["type"] == "user_message"
-            assert user_message["data"]["message"] == "Hello, I need a recipe for pasta"
+            assert user_message["data"]["message"] == _PASTA_CHAT_MESSAGE
             assert user_message["data"]["role"] == "user"
 
-            # Should receive assistant response (may take time due to LLM)
-            # We'll set a timeout for this test
-            try:
-                assistant_msg_data = websocket.receive_text()
-                assistant_message = json.loads(assistant_msg_data)
-
-                assert assistant_message["type"] == "assistant_message"
-                assert "message" in assistant_message["data"]
-                assert assistant_message["data"]["role"] == "assistant"
-                assert "conversation_id" in assistant_message["data"]
-            except Exception:
-                # If LLM service is not available, we might get an error
-                # This is acceptable for testing the WebSocket functionality
-                pass
-
-    def test_websocket_ping_pong(self):
-        """Test WebSocket ping/pong functionality."""
-        user_id = "test_user_789"
-
-        with self.client.websocket_connect(f"/ws/chat/{user_id}") as websocket:
-            # Skip welcome message
-            websocket.receive_text()
-
-            # Send ping
-            ping_message = {"type": "ping"}
-            websocket.send_text(json.dumps(ping_message))
-
-            # Should receive pong
-            pong_data = websocket.receive_text()
-            pong_message = json.loads(pong_data)
-
-            assert pong_message["type"] == "pong"
-            assert pong_message["data"]["message"] == "pong"
+    @pytest.mark.llm
+    @pytest.mark.slow
+    @pytest.mark.xdist_group("llm")
+    def test_websocket_assistant_response(self, app_client: TestClient):
+        """Test that a chat message is answered by the assistant."""
+        user_id = "test_user_456_llm"
 
-    def test_websocket_invalid_message(self):
-        """Test WebSocket with invalid message format."""
-        user_id = "test_user_invalid"
-
-        with self.client.websocket_connect(f"/ws/chat/{user_id}") as websocket:
-            # Skip welcome message
+        with app_client.websocket_connect(f"/ws/chat/{user_id}") as websocket:
+            # Skip welcome message and the user message confirmation
             websocket.receive_text()
-
-            # Send invalid JSON
-            websocket.send_text("invalid json")
-
-            # Should receive error message
-            error_data = websocket.receive_text()
-            error_message = json.loads(error_data)
-
-            assert error_message["type"] == "error"
-            assert "Invalid JSON format" in error_message["data"]["error"]
-
-    def test_websocket_empty_message(self):
-        """Test WebSocket with empty chat message."""
-        user_id = "test_user_empty"
-
-        with self.client.websocket_connect(f"/ws/chat/{user_id}") as websocket:
-            # Skip welcome message
+            websocket.send_text(_PASTA_CHAT_FRAME)
             websocket.receive_text()
 
-            # Send empty message
-            empty_message = {"type": "chat", "message": ""}
-            websocket.send_text(json.dumps(empty_message))
+            # Should receive assistant response from the live LLM
+            assistant_message = orjson.loads(websocket.receive_text())
 
-            # Should receive error message
-            error_data = websocket.receive_text()
-            error_message = json.loads(error_data)
+            assert assistant_message["type"] == "assistant_message"
+            assert "message" in assistant_message["data"]
+            assert assistant_message["data"]["role"] == "assistant"
+            assert "conversation_id" in assistant_message["data"]
 
-            assert error_message["type"] == "error"
-            assert "Message cannot be empty" in error_message["data"]["error"]
-
-    def test_chat_api_endpoint(self):
+    async def test_chat_api_endpoint(
+        self, http_client: AsyncClient, stub_llm: AsyncMock
+    ):
         """Test REST API chat endpoint."""
         chat_request = {
             "message": "I want to make a simple pasta dish",
             "user_id": "test_user_rest",
         }
 
-        response = self.client.post("/api/chat", json=chat_request)
-
-        # Should return 200 or 500 (if LLM service unavailable)
-        assert response.status_code in [200, 500]
+        response = await http_client.post("/api/chat", json=chat_request)
 
-        if response.status_code == 200:
-            data = response.json()
-            assert "message" in data
-            assert "conversation_id" in data
-            assert "citations" in data
+        assert response.status_code == 200
+        data = response.json()
+        assert data["message"] == _STUB_LLM_REPLY
+        assert "conversation_id" in data
+        assert data["citations"] == []
+        stub_llm.assert_awaited_once()
 
-    def test_conversations_api_endpoint(self):
+    async def test_conversations_api_endpoint(self, http_client: AsyncClient):
         """Test conversations API endpoint."""
         user_id = "test_user_conversations"
 
-        response = self.client.get(f"/api/conversations?user_id={user_id}")
+        response = await http_client.get(f"/api/conversations?user_id={user_id}")
         assert response.status_code == 200
 
         data = response.json()
@@ -194,11 +331,11 @@ class TestFrontendIntegration:
         assert "total" in data
         assert isinstance(data["conversations"], list)
 
-    def test_create_conversation_api(self):
+    async def test_create_conversation_api(self, http_client: AsyncClient):
         """Test create conversation API endpoint."""
         user_id = "test_user_create"
 
-        response = self.client.post(f"/api/conversations?user_id={user_id}")
+        response = await http_client.post(f"/api/conversations?user_id={user_id}")
         assert response.status_code == 200
 
         data = response.json()
@@ -206,18 +343,18 @@ class TestFrontendIntegration:
         assert "user_id" in data
         assert data["user_id"] == user_id
 
-    def test_cors_headers(self):
+    async def test_cors_headers(self, http_client: AsyncClient):
         """Test CORS headers are properly set."""
-        response = self.client.options("/api/chat")
+        response = await http_client.options("/api/chat")
 
         # Should have CORS headers
         assert "access-control-allow-origin" in response.headers
         assert "access-control-allow-methods" in response.headers
         assert "access-control-allow-headers" in response.headers
 
-    def test_security_headers(self):
+    async def test_security_headers(self, http_client: AsyncClient):
         """Test security headers are present."""
-        response = self.client.get("/")
+        response = await http_client.get("/")
 
         # Check for security headers (from SecurityHeadersMiddleware)
         headers = response.headers
@@ -225,278 +362,130 @@ class TestFrontendIntegration:
         assert "x-frame-options" in headers
         assert "x-xss-protection" in headers
 
-    def test_frontend_responsive_elements(self):
+    def test_frontend_responsive_elements(self, html_bytes: bytes):
         """Test that frontend contains responsive design elements."""
-        response = self.client.get("/")
-        html_content = response.text
-
         # Check for viewport meta tag
-        assert 'name="viewport"' in html_content
+        assert b'name="viewport"' in html_bytes
 
         # Check for responsive CSS classes
-        assert "mobile-sidebar-toggle" in html_content
-        assert "sidebar" in html_content
-        assert "chat-container" in html_content
+        assert b"mobile-sidebar-toggle" in html_bytes
+        assert b"sidebar" in html_bytes
+        assert b"chat-container" in html_bytes
 
         # Check for Font Awesome icons
-        assert "font-awesome" in html_content
+        assert b"font-awesome" in html_bytes
 
         # Check for Google Fonts
-        assert "fonts.googleapis.com" in html_content
+        assert b"fonts.googleapis.com" in html_bytes
 
-    def test_frontend_accessibility_features(self):
+    def test_frontend_accessibility_features(self, html_bytes: bytes):
         """Test accessibility features in frontend."""
-        response = self.client.get("/")
-        html_content = response.text
-
         # Check for semantic HTML elements
-        assert "<main" in html_content
-        assert "<aside" in html_content
-        assert "<button" in html_content
+        assert b"<main" in html_bytes
+        assert b"<aside" in html_bytes
+        assert b"<button" in html_bytes
 
-        # Check for ARIA labels and roles
-        assert "aria-" in html_content or "role=" in html_content
+        # Check for enough ARIA attributes and roles
+        aria = html_bytes.count(b"aria-")
+        roles = html_bytes.count(b"role=")
+        assert (
+            aria + roles >= _MIN_A11Y_HINTS
+        ), f"Insufficient accessibility hints: aria={aria} role={roles}"
 
         # Check for alt attributes on images (if any)
         # Check for proper form labels
-        assert "<label" in html_content or "placeholder=" in html_content
+        assert b"<label" in html_bytes or b"placeholder=" in html_bytes
 
-    def test_frontend_performance_features(self):
+    def test_frontend_performance_features(
+        self, html_bytes: bytes, scripts_non_blocking: bool
+    ):
         """Test performance optimization features."""
-        response = self.client.get("/")
-        html_content = response.text
-
         # Check for preconnect links
-        assert "preconnect" in html_content
+        assert b"preconnect" in html_bytes
 
         # Check for font display optimization
-        assert "display=swap" in html_content
+        assert b"display=swap" in html_bytes
 
         # Check for efficient loading
-        assert (
-            "defer" in html_content
-            or "async" in html_content
-            or html_content.find("<script") > html_content.find("</body>") - 200
-        )
+        assert scripts_non_blocking, "Scripts block rendering"
 
-    def test_websocket_multiple_connections(self):
+    async def test_websocket_multiple_connections(self):
         """Test multiple WebSocket connections."""
         user_id_1 = "test_user_multi_1"
         user_id_2 = "test_user_multi_2"
 
-        with self.client.websocket_connect(f"/ws/chat/{user_id_1}") as ws1:
-            with self.client.websocket_connect(f"/ws/chat/{user_id_2}") as ws2:
-                # Both should receive welcome messages
-                welcome1 = json.loads(ws1.receive_text())
-                welcome2 = json.loads(ws2.receive_text())
+        # The transport's task group must be entered and exited in this task,
+        # so the client cannot come from a fixture
+        transport = ASGIWebSocketTransport(app=app)
+        async with AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as ws_client:
+            async with aconnect_ws(f"/ws/chat/{user_id_1}", ws_client) as ws1:
+                async with aconnect_ws(f"/ws/chat/{user_id_2}", ws_client) as ws2:
+                    # Both should receive welcome messages
+                    welcome1, welcome2 = map(
+                        orjson.loads,
+                        await asyncio.gather(ws1.receive_text(), ws2.receive_text()),
+                    )
+
+                    assert welcome1["data"]["user_id"] == user_id_1
+                    assert welcome2["data"]["user_id"] == user_id_2
+
+                    # Send messages from both connections
+                    await asyncio.gather(
+                        ws1.send_text(_PING_FRAME), ws2.send_text(_PING_FRAME)
+                    )
+
+                    # Both should receive pong responses
+                    pong1, pong2 = map(
+                        orjson.loads,
+                        await asyncio.gather(ws1.receive_text(), ws2.receive_text()),
+                    )
+
+                    assert pong1["type"] == "pong"
+                    assert pong2["type"] == "pong"
 
-                assert welcome1["data"]["user_id"] == user_id_1
-                assert welcome2["data"]["user_id"] == user_id_2
 
-                # Send messages from both connections
-                ws1.send_text(json.dumps({"type": "ping"}))
-                ws2.send_text(json.dumps({"type": "ping"}))
+class TestFrontendUIComponents:
+    """Test frontend UI components and interactions."""
 
-                # Both should receive pong responses
-                pong1 = json.loads(ws1.receive_text())
-                pong2 = json.loads(ws2.receive_text())
+    @pytest.mark.parametrize("needle", sorted(_EXPECTED_CSS_TOKENS))
+    def test_css_contains(self, css_bytes: bytes, needle: bytes):
+        """Test that the stylesheet defines each expected snippet."""
+        assert needle in css_bytes, f"{needle.decode()} not found in CSS"
 
-                assert pong1["type"] == "pong"
-                assert pong2["type"] == "pong"
+    @pytest.mark.parametrize("needle", sorted(_EXPECTED_JS_TOKENS))
+    def test_js_contains(self, js_bytes: bytes, needle: bytes):
+        """Test that the application script contains each expected snippet."""
+        assert needle in js_bytes, f"{needle.decode()} not found in JavaScript"
 
+    def test_javascript_element_queries(self, js_bytes: bytes):
+        """Test that the application script queries elements by selector."""
+        assert b"querySelector(" in js_bytes or b"querySelectorAll(" in js_bytes
 
-class TestFrontendUIComponents:
-    """Test frontend UI components and interactions."""
+    @pytest.mark.parametrize("needle", sorted(_EXPECTED_HTML_TOKENS))
+    def test_html_contains(self, html_bytes: bytes, needle: bytes):
+        """Test that the index page contains each expected snippet."""
+        assert needle in html_bytes, f"{needle.decode()} not found in HTML"
 
-    def setup_method(self):
-        """Set up test client."""
-        self.client = TestClient(app)
-
-    def test_css_variables_defined(self):
-        """Test that CSS custom properties are properly defined."""
-        response = self.client.get("/static/css/styles.css")
-        css_content = response.text
-
-        # Check for essential CSS variables
-        assert "--primary-color:" in css_content
-        assert "--bg-primary:" in css_content
-        assert "--text-primary:" in css_content
-        assert "--border-light:" in css_content
-        assert "--spacing-md:" in css_content
-        assert "--radius-md:" in css_content
-        assert "--transition-fast:" in css_content
-
-    def test_responsive_breakpoints(self):
-        """Test responsive design breakpoints."""
-        response = self.client.get("/static/css/styles.css")
-        css_content = response.text
-
-        # Check for mobile breakpoints
-        assert "@media (max-width: 768px)" in css_content
-        assert "@media (max-width: 480px)" in css_content
-
-        # Check for responsive classes
-        assert ".mobile-sidebar-toggle" in css_content
-        assert ".sidebar.open" in css_content
-
-    def test_accessibility_css_features(self):
-        """Test CSS accessibility features."""
-        response = self.client.get("/static/css/styles.css")
-        css_content = response.text
-
-        # Check for reduced motion support
-        assert "@media (prefers-reduced-motion: reduce)" in css_content
-
-        # Check for high contrast support
-        assert "@media (prefers-contrast: high)" in css_content
-
-        # Check for dark mode support
-        assert "@media (prefers-color-scheme: dark)" in css_content
-
-    def test_animation_definitions(self):
-        """Test CSS animation definitions."""
-        response = self.client.get("/static/css/styles.css")
-        css_content = response.text
-
-        # Check for keyframe animations
-        assert "@keyframes fadeInUp" in css_content
-        assert "@keyframes typing" in css_content
-        assert "@keyframes modalSlideIn" in css_content
-
-    def test_component_styles_present(self):
+    def test_component_styles_present(self, css_bytes: bytes):
         """Test that all component styles are present."""
-        response = self.client.get("/static/css/styles.css")
-        css_content = response.text
-
-        # Check for main component classes
-        components = [
-            ".app-container",
-            ".sidebar",
-            ".chat-container",
-            ".messages-container",
-            ".message",
-            ".message-bubble",
-            ".typing-indicator",
-            ".input-container",
-            ".recipe-card",
-            ".citation",
-            ".modal",
-            ".loading-overlay",
-        ]
-
-        for component in components:
-            assert component in css_content, f"Component {component} not found in CSS"
-
-    def test_javascript_class_structure(self):
-        """Test JavaScript class structure."""
-        response = self.client.get("/static/js/app.js")
-        js_content = response.text
-
-        # Check for main class
-        assert "class MakeMyRecipeApp" in js_content
-
-        # Check for essential methods
-        methods = [
-            "constructor()",
-            "connect()",
-            "sendMessage()",
-            "displayMessage(",
-            "handleWebSocketMessage(",
-            "loadConversations(",
-            "showTypingIndicator(",
-            "hideTypingIndicator(",
-        ]
-
-        for method in methods:
-            assert method in js_content, f"Method {method} not found in JavaScript"
-
-    def test_javascript_error_handling(self):
-        """Test JavaScript error handling."""
-        response = self.client.get("/static/js/app.js")
-        js_content = response.text
-
-        # Check for try-catch blocks
-        assert "try {" in js_content
-        assert "catch (error)" in js_content
-
-        # Check for error handling methods
-        assert "showError(" in js_content
-        assert "handleConnectionError(" in js_content
-        assert "handleWebSocketError(" in js_content
-
-    def test_javascript_websocket_handling(self):
-        """Test JavaScript WebSocket handling."""
-        response = self.client.get("/static/js/app.js")
-        js_content = response.text
-
-        # Check for WebSocket event handlers
-        assert "onopen" in js_content
-        assert "onmessage" in js_content
-        assert "onclose" in js_content
-        assert "onerror" in js_content
-
-        # Check for reconnection logic
-        assert "attemptReconnect(" in js_content
-        assert "reconnectAttempts" in js_content
-
-    def test_javascript_dom_manipulation(self):
-        """Test JavaScript DOM manipulation."""
-        response = self.client.get("/static/js/app.js")
-        js_content = response.text
-
-        # Check for DOM methods
-        assert "getElementById(" in js_content
-        assert "createElement(" in js_content
-        assert "appendChild(" in js_content
-        assert "addEventListener(" in js_content
-
-        # Check for element queries
-        assert "querySelector(" in js_content or "querySelectorAll(" in js_content
-
-    def test_html_semantic_structure(self):
+        found = {b"." + match for match in _COMPONENT_RE.findall(css_bytes)}
+        missing = [c.decode() for c in _COMPONENT_CLASSES if c not in found]
+        assert not missing, f"Components not found in CSS: {missing}"
+
+    @pytest.mark.parametrize("method", _APP_METHODS)
+    def test_javascript_class_structure(self, js_bytes: bytes, method: bytes):
+        """Test that the application class defines each essential method."""
+        assert method in js_bytes, f"Method {method.decode()} not found in JavaScript"
+
+    @pytest.mark.parametrize("snippet", _ERROR_HANDLING_SNIPPETS)
+    def test_javascript_error_handling(self, js_bytes: bytes, snippet: bytes):
+        """Test that the application script handles errors."""
+        assert snippet in js_bytes, f"{snippet.decode()} not found in JavaScript"
+
+    def test_html_semantic_structure(self, html_bytes: bytes):
         """Test HTML semantic structure."""
-        response = self.client.get("/")
-        html_content = response.text
-
-        # Check for semantic HTML5 elements
-        semantic_elements = [
-            "<main",
-            "<aside",
-            "<header",
-            "<nav",
-            "<section",
-            "<article",
-        ]
-
-        # At least some semantic elements should be present
-        semantic_found = any(element in html_content for element in semantic_elements)
+        # At least some semantic HTML5 elements should be present
+        semantic_found = _SEMANTIC_ELEMENT_RE.search(html_bytes)
         assert semantic_found, "No semantic HTML5 elements found"
-
-    def test_html_form_elements(self):
-        """Test HTML form elements."""
-        response = self.client.get("/")
-        html_content = response.text
-
-        # Check for form elements
-        assert "<textarea" in html_content
-        assert "<button" in html_content
-        assert "<input" in html_content
-
-        # Check for proper attributes
-        assert 'type="text"' in html_content
-        assert "placeholder=" in html_content
-        assert "maxlength=" in html_content
-
-    def test_html_meta_tags(self):
-        """Test HTML meta tags."""
-        response = self.client.get("/")
-        html_content = response.text
-
-        # Check for essential meta tags
-        assert '<meta charset="UTF-8">' in html_content
-        assert 'name="viewport"' in html_content
-        assert "<title>" in html_content
-
-        # Check for external resources
-        assert 'rel="stylesheet"' in html_content
-        assert 'rel="preconnect"' in html_content
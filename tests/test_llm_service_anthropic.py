@@ -70,6 +70,14 @@ class TestLLMServiceAnthropicIntegration:
                 messages
             ), f"Should not detect recipe query: {query}"
 
+    def test_is_recipe_query_ignores_case_and_word_boundaries(self, llm_service):
+        """Test that keywords match in any case and inside longer words."""
+        for query in ["BAKING BREAD TONIGHT", "Any seafood ideas?"]:
+            messages = [ChatMessage(role="user", content=query)]
+            assert llm_service._is_recipe_query(
+                messages
+            ), f"Should detect recipe query: {query}"
+
     def test_is_recipe_query_empty_messages(self, llm_service):
         """Test recipe query detection with empty messages."""
         assert not llm_service._is_recipe_query([])
@@ -1,5 +1,6 @@
 """Tests for recipe service functionality."""
 
+from typing import Iterator
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -24,6 +25,16 @@ class TestRecipeService:
         """Create a RecipeService instance for testing."""
         return RecipeService()
 
+    @pytest.fixture
+    def mock_generate(self, recipe_service: RecipeService) -> Iterator[AsyncMock]:
+        """Patch the Anthropic service's generate_recipe_response with an AsyncMock."""
+        with patch.object(
+            recipe_service.anthropic_service,
+            "generate_recipe_response",
+            new_callable=AsyncMock,
+        ) as mock_generate:
+            yield mock_generate
+
     @pytest.fixture
     def mock_anthropic_response(self) -> tuple:
         """Mock Anthropic service response."""
@@ -189,114 +200,103 @@ class TestRecipeService:
 
     @pytest.mark.asyncio
     async def test_search_recipes_success(
-        self, recipe_service: RecipeService, mock_anthropic_response: tuple
+        self,
+        recipe_service: RecipeService,
+        mock_generate: AsyncMock,
+        mock_anthropic_response: tuple,
     ) -> None:
         """Test successful recipe search."""
         content, citations = mock_anthropic_response
 
-        with patch.object(
-            recipe_service.anthropic_service,
-            "generate_recipe_response",
-            new_callable=AsyncMock,
-        ) as mock_generate:
-            mock_generate.return_value = (content, citations)
+        mock_generate.return_value = (content, citations)
 
-            query = RecipeSearchQuery(ingredients=["pasta"])
-            recipes, raw_response = await recipe_service.search_recipes(
-                "pasta recipe", query
-            )
+        query = RecipeSearchQuery(ingredients=["pasta"])
+        recipes, raw_response = await recipe_service.search_recipes(
+            "pasta recipe", query
+        )
 
-            assert len(recipes) == 1
-            assert recipes[0].title == "Spaghetti Carbonara"
-            assert raw_response == content
+        assert len(recipes) == 1
+        assert recipes[0].title == "Spaghetti Carbonara"
+        assert raw_response == content
 
-            # Verify the anthropic service was called correctly
-            mock_generate.assert_called_once()
-            call_args = mock_generate.call_args
-            assert call_args[1]["use_web_search"] is True
-            assert len(call_args[1]["messages"]) == 1
-            assert "pasta recipe" in call_args[1]["messages"][0].content
+        # Verify the anthropic service was called correctly
+        mock_generate.assert_called_once()
+        call_args = mock_generate.call_args
+        assert call_args[1]["use_web_search"] is True
+        assert len(call_args[1]["messages"]) == 1
+        assert "pasta recipe" in call_args[1]["messages"][0].content
 
     @pytest.mark.asyncio
     async def test_search_recipes_error_handling(
-        self, recipe_service: RecipeService
+        self, recipe_service: RecipeService, mock_generate: AsyncMock
     ) -> None:
         """Test recipe search error handling."""
-        with patch.object(
-            recipe_service.anthropic_service,
-            "generate_recipe_response",
-            new_callable=AsyncMock,
-        ) as mock_generate:
-            mock_generate.side_effect = Exception("API Error")
+        mock_generate.side_effect = Exception("API Error")
 
-            recipes, raw_response = await recipe_service.search_recipes("test query")
+        recipes, raw_response = await recipe_service.search_recipes("test query")
 
-            assert len(recipes) == 0
-            assert "error" in raw_response.lower()
+        assert len(recipes) == 0
+        assert "error" in raw_response.lower()
 
     @pytest.mark.asyncio
     async def test_get_recipe_suggestions(
-        self, recipe_service: RecipeService, mock_anthropic_response: tuple
+        self,
+        recipe_service: RecipeService,
+        mock_generate: AsyncMock,
+        mock_anthropic_response: tuple,
     ) -> None:
         """Test ingredient-based recipe suggestions."""
         content, citations = mock_anthropic_response
 
-        with patch.object(
-            recipe_service.anthropic_service,
-            "generate_recipe_response",
-            new_callable=AsyncMock,
-        ) as mock_generate:
-            mock_generate.return_value = (content, citations)
+        mock_generate.return_value = (content, citations)
 
-            ingredients = ["chicken", "rice", "vegetables"]
-            dietary_restrictions = [DietaryRestriction.GLUTEN_FREE]
+        ingredients = ["chicken", "rice", "vegetables"]
+        dietary_restrictions = [DietaryRestriction.GLUTEN_FREE]
 
-            recipes, raw_response = await recipe_service.get_recipe_suggestions(
-                ingredients, dietary_restrictions
-            )
+        recipes, raw_response = await recipe_service.get_recipe_suggestions(
+            ingredients, dietary_restrictions
+        )
 
-            assert len(recipes) == 1
-            assert raw_response == content
+        assert len(recipes) == 1
+        assert raw_response == content
 
-            # Verify the call was made with correct parameters
-            mock_generate.assert_called_once()
-            call_args = mock_generate.call_args
-            # Check keyword arguments instead of positional
-            assert call_args[1]["use_web_search"] is True
-            messages = call_args[1]["messages"]
-            assert len(messages) == 1
-            assert "chicken, rice, vegetables" in messages[0].content
+        # Verify the call was made with correct parameters
+        mock_generate.assert_called_once()
+        call_args = mock_generate.call_args
+        # Check keyword arguments instead of positional
+        assert call_args[1]["use_web_search"] is True
+        messages = call_args[1]["messages"]
+        assert len(messages) == 1
+        assert "chicken, rice, vegetables" in messages[0].content
 
     @pytest.mark.asyncio
     async def test_get_cuisine_recipes(
-        self, recipe_service: RecipeService, mock_anthropic_response: tuple
+        self,
+        recipe_service: RecipeService,
+        mock_generate: AsyncMock,
+        mock_anthropic_response: tuple,
     ) -> None:
         """Test cuisine-specific recipe search."""
         content, citations = mock_anthropic_response
 
-        with patch.object(
-            recipe_service.anthropic_service,
-            "generate_recipe_response",
-            new_callable=AsyncMock,
-        ) as mock_generate:
-            mock_generate.return_value = (content, citations)
-
-            recipes, raw_response = await recipe_service.get_cuisine_recipes(
-                CuisineType.ITALIAN, DifficultyLevel.BEGINNER
-            )
-
-            assert len(recipes) == 1
-            assert raw_response == content
-
-            # Verify the call was made with correct parameters
-            mock_generate.assert_called_once()
-            call_args = mock_generate.call_args
-            # Check keyword arguments instead of positional
-            assert call_args[1]["use_web_search"] is True
-            messages = call_args[1]["messages"]
-            assert len(messages) == 1
-            assert "italian recipes" in messages[0].content
-            assert "beginner level" in messages[0].content
+        mock_generate.return_value = (content, citations)
+
+        recipes, raw_response = await recipe_service.get_cuisine_recipes(
+            CuisineType.ITALIAN, DifficultyLevel.BEGINNER
+        )
+
+        assert len(recipes) == 1
+        assert raw_response == content
+
+        # Verify the call was made with correct parameters
+        mock_generate.assert_called_once()
+        call_args = mock_generate.call_args
+        # Check keyword arguments instead of positional
+        assert call_args[1]["use_web_search"] is True
+        messages = call_args[1]["messages"]
+        assert len(messages) == 1
+        assert "italian recipes" in messages[0].content
+        assert "beginner level" in messages[0].content
 
     def test_optimize_search_query(self, recipe_service: RecipeService) -> None:
         """Test search query optimization."""
@@ -137,6 +137,28 @@ class TestSearchTagFunctionality:
         assert "uppercase search" not in cleaned_text
         assert "mixed case" not in cleaned_text
 
+    def test_split_search_tags_matches_separate_helpers(self, anthropic_service):
+        """Test that the single-pass split agrees with extract and remove."""
+        text = (
+            "Sure! <search>pasta carbonara</search> One moment. <search> </search>"
+            " <SEARCH>vegan carbonara</SEARCH> Done."
+        )
+
+        queries, cleaned_text = anthropic_service._split_search_tags(text)
+
+        assert queries == ["pasta carbonara", "vegan carbonara"]
+        assert queries == anthropic_service._extract_search_queries(text)
+        assert cleaned_text == anthropic_service._remove_search_tags(text)
+
+    def test_split_search_tags_no_tags(self, anthropic_service):
+        """Test splitting text without search tags."""
+        text = "  Just a regular answer.  "
+
+        queries, cleaned_text = anthropic_service._split_search_tags(text)
+
+        assert queries == []
+        assert cleaned_text == "Just a regular answer."
+
     @pytest.mark.asyncio
     async def test_perform_search_success(self, anthropic_service):
         """Test successful search execution."""
@@ -242,6 +242,7 @@ def test_chat_service_add_threaded_message(temp_chat_service) -> None:
 def test_chat_service_update_conversation_metadata(temp_chat_service) -> None:
     """Test updating conversation metadata."""
     conversation = temp_chat_service.create_conversation("test_user")
+    conversation.get_size_estimate()
 
     updated = temp_chat_service.update_conversation_metadata(
         conversation.conversation_id,
@@ -256,6 +257,7 @@ def test_chat_service_update_conversation_metadata(temp_chat_service) -> None:
     assert "pasta" in updated.metadata.tags
     assert "italian" in updated.metadata.cuisine_preferences
     assert "vegetarian" in updated.metadata.dietary_restrictions
+    assert updated.get_size_estimate() == len(updated.model_dump_json())
 
 
 def test_chat_service_search_conversations(temp_chat_service) -> None:
@@ -55,3 +55,12 @@ class TestAPIEndpoints:
         assert "openapi" in data
         assert "info" in data
         assert data["info"]["title"] == "MakeMyRecipe"
+
+    def test_openapi_schema_cached_at_startup(self, client: TestClient):
+        """Test that startup builds the OpenAPI schema once and reuses it."""
+        schema = client.app.openapi_schema
+        assert schema is not None
+
+        response = client.get("/openapi.json")
+        assert response.status_code == 200
+        assert client.app.openapi_schema is schema